@@ -1,15 +1,13 @@
 
 import sys
-import json
 import os
-from PyQt6.QtWidgets import QApplication, QMainWindow, QMenuBar, QDockWidget, QWidget, QVBoxLayout, QPushButton, QMenu, QDialog, QFileDialog, QMessageBox
-from PyQt6.QtGui import QAction
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtWidgets import QApplication, QMainWindow, QDockWidget, QWidget, QVBoxLayout, QPushButton, QMenu, QDialog, QFileDialog, QMessageBox
+from PyQt6.QtGui import QColor, QPalette
+from PyQt6.QtCore import Qt, QTimer, QThreadPool
 
 from editor.flowchart_canvas import FlowchartCanvas
-from editor.toolbox import Toolbox
-from editor.project_panel import ProjectPanel
-from editor.setup_dialog import SetupDialog
+from editor.tag_loader import TagLoadWorker
+from editor.startup_dialog import StartupChoiceDialog, StartupChoice
 
 # Import tag manager for synchronization
 try:
@@ -20,10 +18,42 @@ except ImportError:
 # Import improved error handling and utilities
 from utils import (
     get_logger, ErrorHandler, ProjectFileError, ProjectDataError,
-    validate_file_path, validate_json_file, validate_project_data,
-    log_method_entry
+    validate_file_path, load_mapped_json_file, validate_project_data,
+    log_method_entry, json_io,
+    is_project_container, read_project_container, write_project_container
 )
 
+# Name filter for the open/save project dialogs
+PROJECT_FILE_FILTER = 'PLC Project Files (*.plc);;JSON Files (*.json);;All Files (*)'
+
+# Write buffer for project saves (bytes)
+SAVE_BUFFER_SIZE = 1 << 20
+
+# Global stylesheet shared by every launch path
+STYLESHEET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "app.qss")
+_global_stylesheet = None
+
+def load_global_stylesheet() -> str:
+    """Read the global application stylesheet once, or return '' if it is missing"""
+    global _global_stylesheet
+    if _global_stylesheet is None:
+        try:
+            with open(STYLESHEET_PATH, 'r', encoding='utf-8') as f:
+                _global_stylesheet = f.read()
+        except OSError as e:
+            get_logger('Main').warning(f"Could not load stylesheet {STYLESHEET_PATH}: {e}")
+            _global_stylesheet = ""
+    return _global_stylesheet
+
+def apply_global_palette(app: QApplication):
+    """Set the selection/alternate-row colors for every item view through the palette"""
+    palette = app.palette()
+    # Set for all color groups so selections keep their color when a view loses focus
+    palette.setColor(QPalette.ColorRole.Highlight, QColor("#3daee9"))
+    palette.setColor(QPalette.ColorRole.HighlightedText, QColor("white"))
+    palette.setColor(QPalette.ColorRole.AlternateBase, QColor("#f0f0f0"))
+    app.setPalette(palette)
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -34,28 +64,90 @@ class MainWindow(QMainWindow):
         
         self.setWindowFlag(Qt.WindowType.WindowMaximizeButtonHint, False)
         self.resize(1400,800)
-        self.setWindowTitle("Embedded PLC Flowchart GUI")
+        self._last_title = ""
+        self._set_title("Embedded PLC Flowchart GUI[*]")
         self.canvas = FlowchartCanvas(self)
         self.setCentralWidget(self.canvas)
         
         # Connect to track project modifications
         self.canvas.project_modified.connect(self.mark_project_modified)
 
-        self.td = QDockWidget("Logic Blocks",self)
-        self.td.setWidget(Toolbox(self.canvas))
-        self.td.setAllowedAreas(Qt.DockWidgetArea.RightDockWidgetArea)
-        self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea,self.td)
+        # Docks and the Tags dialog are built on first use (see _ensure_* below)
+        # so the first paint of the main window is not blocked on them
+        self._td = None
+        # SetupDialog is imported on the first Setup click
+        self._setup_dialog_cls = None
+        # Shared open/save/directory dialog, created on first use
+        self._file_dialog = None
+        self._pd = None
+        self.tag_dialog = None
+        self.variable_panel = None
+        self._pending_external_tags = []
+        self._variable_panel_reset_pending = False
+
+        # Parse the tag JSON files on a worker thread so the Tags dialog is cheap to build
+        self._preloaded_tag_data = None
+        self._tag_loader = TagLoadWorker()
+        self._tag_loader.signals.finished.connect(self._on_tags_preloaded)
+        QThreadPool.globalInstance().start(self._tag_loader)
+
+        self.setMenuWidget(self._build_menu_bar())
+
+        # Tags added from logic blocks are queued until the variable panel exists;
+        # _ensure_tag_dialog then connects the panel to tag_manager directly
+        if tag_manager is not None:
+            tag_manager.tag_added.connect(self._queue_external_tag)
 
-        self.pd = QDockWidget("Solution",self)
-        self.pd.setWidget(ProjectPanel())
-        self.pd.setAllowedAreas(Qt.DockWidgetArea.LeftDockWidgetArea)
-        self.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea,self.pd)
+        # Initialize project state
+        self.current_project_file = None
+        self.project_modified = False
 
-        # Setup button (pop-out) placed in menu bar to the right of File menu
-        setup_btn = QPushButton("Setup", self)
-        setup_btn.setFixedWidth(80)
-        setup_btn.clicked.connect(self.show_setup_dialog)
-        self.setup_btn = setup_btn
+        # Bursts of modification signals (drag, paste) are coalesced into one update
+        self._pending_modified = False
+        self._dirty_timer = QTimer(self)
+        self._dirty_timer.setSingleShot(True)
+        self._dirty_timer.setInterval(50)
+        self._dirty_timer.timeout.connect(self._flush_modified)
+        
+        # Docks are built after the first show (see showEvent), then the startup dialog
+        self._docks_scheduled = False
+        self._startup_dialog = None
+        QTimer.singleShot(100, self.show_startup_dialog)
+
+    def showEvent(self, event):
+        """Schedule dock construction once the window is first shown"""
+        super().showEvent(event)
+        if not self._docks_scheduled:
+            self._docks_scheduled = True
+            QTimer.singleShot(0, self._ensure_docks)
+
+    def _build_menu_bar(self):
+        """Build the compact menu bar widget from a table of menus and buttons"""
+        # Each entry is either a menu (label, [action specs]) or a button (label, slot).
+        # Action spec: (text, slot, attribute name or None, options) or None for a separator.
+        # File actions go through lambdas so the triggered(bool) argument is dropped.
+        menu_spec = [
+            ("File", [
+                ("New Project", lambda: self.new_project(), None, {}),
+                ("Open Project", lambda: self.open_project(), None, {}),
+                ("Save Project", lambda: self.save_project(), None, {}),
+                ("Save Project As", lambda: self.save_project_as(), None, {}),
+            ]),
+            # Setup button (pop-out) placed in menu bar to the right of File menu
+            ("Setup", self.show_setup_dialog),
+            ("View", [
+                ("Show Toolbox", self._ensure_toolbox, None, {}),
+                ("Show Project", self._ensure_project_dock, None, {}),
+                None,
+                ("Reload Block Config", self.refresh_block_config, None, {}),
+            ]),
+            ("Debug", [
+                ("Enable Debug Mode", self.toggle_debug_mode, 'debug_mode_action', {'checkable': True}),
+                # Show Values is disabled until debug mode is enabled
+                ("Show Values", self.toggle_show_values, 'show_values_action', {'checkable': True, 'enabled': False}),
+            ]),
+            ("Tags", self.show_tag_dialog),
+        ]
 
         # Custom menu bar widget for precise placement and compact style
         from PyQt6.QtWidgets import QHBoxLayout
@@ -64,80 +156,87 @@ class MainWindow(QMainWindow):
         menu_layout.setContentsMargins(2, 2, 2, 2)
         menu_layout.setSpacing(2)
 
-        btn_style = "QPushButton { min-width: 50px; max-width: 60px; min-height: 22px; max-height: 24px; font-size: 10pt; }"
-
-        # File menu
-        file_menu = QMenu("File", self)
-        act_new = QAction("New Project", self)
-        act_open = QAction("Open Project", self)
-        act_save = QAction("Save Project", self)
-        act_saveas = QAction("Save Project As", self)
-        file_menu.addAction(act_new)
-        file_menu.addAction(act_open)
-        file_menu.addAction(act_save)
-        file_menu.addAction(act_saveas)
-        file_menu_btn = QPushButton("File", self)
-        file_menu_btn.setMenu(file_menu)
-        file_menu_btn.setStyleSheet(btn_style)
-        menu_layout.addWidget(file_menu_btn)
-
-        # Setup button
-        self.setup_btn.setStyleSheet(btn_style)
-        menu_layout.addWidget(self.setup_btn)
-
-        # View menu
-        view_menu = QMenu("View", self)
-        act_toolbox = QAction("Show Toolbox", self)
-        act_toolbox.triggered.connect(self.td.show)
-        view_menu.addAction(act_toolbox)
-        act_project = QAction("Show Project", self)
-        act_project.triggered.connect(self.pd.show)
-        view_menu.addAction(act_project)
-        view_menu.addSeparator()
-        act_refresh = QAction("Reload Block Config", self)
-        act_refresh.triggered.connect(self.refresh_block_config)
-        view_menu.addAction(act_refresh)
-        view_menu_btn = QPushButton("View", self)
-        view_menu_btn.setMenu(view_menu)
-        view_menu_btn.setStyleSheet(btn_style)
-        menu_layout.addWidget(view_menu_btn)
-
-        # Debug menu
-        debug_menu = QMenu("Debug", self)
-        self.debug_mode_action = QAction("Enable Debug Mode", self)
-        self.debug_mode_action.setCheckable(True)
-        self.debug_mode_action.triggered.connect(self.toggle_debug_mode)
-        debug_menu.addAction(self.debug_mode_action)
-        
-        self.show_values_action = QAction("Show Values", self)
-        self.show_values_action.setCheckable(True)
-        self.show_values_action.setEnabled(False)  # Disabled until debug mode is enabled
-        self.show_values_action.triggered.connect(self.toggle_show_values)
-        debug_menu.addAction(self.show_values_action)
-        
-        debug_menu_btn = QPushButton("Debug", self)
-        debug_menu_btn.setMenu(debug_menu)
-        debug_menu_btn.setStyleSheet(btn_style)
-        menu_layout.addWidget(debug_menu_btn)
-
-        # Tags action as a button
-        act_tags = QAction("Tags", self)
-        tags_btn = QPushButton("Tags", self)
-        tags_btn.setStyleSheet(btn_style)
-        menu_layout.addWidget(tags_btn)
+        for label, target in menu_spec:
+            btn = QPushButton(label, self)
+            # Sized by the QPushButton#MenuBtn rule in resources/app.qss
+            btn.setObjectName("MenuBtn")
+            if callable(target):
+                btn.clicked.connect(target)
+            else:
+                menu = QMenu(label, self)
+                for action_spec in target:
+                    if action_spec is None:
+                        menu.addSeparator()
+                        continue
+                    text, slot, attr, options = action_spec
+                    # The menu creates and owns the action; attr keeps a handle for later use
+                    action = menu.addAction(text)
+                    if options.get('checkable', False):
+                        action.setCheckable(True)
+                    if not options.get('enabled', True):
+                        action.setEnabled(False)
+                    action.triggered.connect(slot)
+                    if attr:
+                        setattr(self, attr, action)
+                btn.setMenu(menu)
+            menu_layout.addWidget(btn)
+            if label == "Setup":
+                btn.setFixedWidth(80)
+                self.setup_btn = btn
 
         menu_layout.addStretch(1)
-        self.setMenuWidget(menu_widget)
+        return menu_widget
+
+    def _ensure_toolbox(self):
+        """Create the Logic Blocks dock on first use and show it"""
+        if self._td is None:
+            from editor.toolbox import Toolbox
+            self._td = QDockWidget("Logic Blocks",self)
+            self._td.setWidget(Toolbox(self.canvas))
+            self._td.setAllowedAreas(Qt.DockWidgetArea.RightDockWidgetArea)
+            self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea,self._td)
+        self._td.show()
+        return self._td
+
+    def _ensure_project_dock(self):
+        """Create the Solution dock on first use and show it"""
+        if self._pd is None:
+            from editor.project_panel import ProjectPanel
+            self._pd = QDockWidget("Solution",self)
+            self._pd.setWidget(ProjectPanel())
+            self._pd.setAllowedAreas(Qt.DockWidgetArea.LeftDockWidgetArea)
+            self.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea,self._pd)
+        self._pd.show()
+        return self._pd
+
+    def _ensure_docks(self):
+        """Build both docks after the main window has been shown"""
+        # Add both docks under one layout pass instead of repainting after each
+        self.setUpdatesEnabled(False)
+        try:
+            self._ensure_toolbox()
+            self._ensure_project_dock()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _ensure_tag_dialog(self):
+        """Create the Tags dialog and its VariablePanel on first use"""
+        if self.tag_dialog is not None:
+            return self.tag_dialog
 
         # Tags panel as a resizable dialog
         from editor.variable_panel import VariablePanel
-        self.tag_dialog = QDialog(self)
+        self.tag_dialog = QDialog(
+            self,
+            Qt.WindowType.Dialog | Qt.WindowType.WindowTitleHint | Qt.WindowType.WindowCloseButtonHint
+        )
         self.tag_dialog.setWindowTitle("ESP32-S3-WROOM PLC Tags/Variables Manager")
         self.tag_dialog.resize(1200, 800)  # Larger size for enhanced interface
         tag_layout = QVBoxLayout(self.tag_dialog)
         
-        # Create the enhanced variable panel
-        self.variable_panel = VariablePanel()
+        # Create the enhanced variable panel, reusing preloaded JSON when available
+        self.variable_panel = VariablePanel(self._preloaded_tag_data)
+        self._preloaded_tag_data = None
         # Set up tag manager reference for auto-save/auto-load functionality
         self.variable_panel.tag_manager = tag_manager
         tag_layout.addWidget(self.variable_panel)
@@ -145,57 +244,70 @@ class MainWindow(QMainWindow):
         
         # Connect variable panel signals
         self.variable_panel.tags_modified.connect(self.mark_project_modified)
-        
-        # Connect to TagManager signals to refresh main window tags when tags are added from logic blocks
-        if tag_manager is not None:
-            tag_manager.tag_added.connect(self.on_external_tag_added)
 
-        def show_tag_dialog():
-            # Refresh the variable panel to show any new tags added from logic blocks
-            if hasattr(self.variable_panel, 'update_tag_tree'):
-                self.variable_panel.update_tag_tree()
-            
-            # Center the dialog in the main window
-            parent_geom = self.geometry()
-            dlg_geom = self.tag_dialog.frameGeometry()
-            center_point = parent_geom.center()
-            dlg_geom.moveCenter(center_point)
-            self.tag_dialog.move(dlg_geom.topLeft())
-            self.tag_dialog.show()
-
-        tags_btn.clicked.connect(show_tag_dialog)
-
-        # Connect file menu actions
-        act_new.triggered.connect(lambda: self.new_project())
-        act_open.triggered.connect(lambda: self.open_project())
-        act_save.triggered.connect(lambda: self.save_project())
-        act_saveas.triggered.connect(lambda: self.save_project_as())
-        
-        # Initialize project state
-        self.current_project_file = None
-        self.project_modified = False
-        
-        # Show startup dialog after UI is fully initialized
-        QTimer.singleShot(100, self.show_startup_dialog)
+        # Apply a project reset requested before the panel existed
+        if self._variable_panel_reset_pending:
+            self._variable_panel_reset_pending = False
+            self._reset_variable_panel()
+            if hasattr(self.variable_panel, 'auto_load_tags'):
+                self.variable_panel.auto_load_tags()
+
+        # Hand tag_added over to the panel and drain tags queued before it existed
+        if tag_manager is not None:
+            tag_manager.tag_added.disconnect(self._queue_external_tag)
+        pending, self._pending_external_tags = self._pending_external_tags, []
+        on_tag_added = getattr(self.variable_panel, 'on_external_tag_added', None)
+        if on_tag_added is not None:
+            if tag_manager is not None:
+                tag_manager.tag_added.connect(on_tag_added)
+            for tag_name in pending:
+                on_tag_added(tag_name)
+
+        return self.tag_dialog
+
+    def _ensure_variable_panel(self):
+        """Return the VariablePanel, building the Tags dialog around it if needed"""
+        self._ensure_tag_dialog()
+        return self.variable_panel
+
+    def _on_tags_preloaded(self, data):
+        """Keep the tag data parsed by TagLoadWorker for the VariablePanel"""
+        if self.variable_panel is None:
+            self._preloaded_tag_data = data
+
+    def show_tag_dialog(self):
+        """Show the Tags dialog centered on the main window"""
+        self._ensure_tag_dialog()
+
+        # Refresh the variable panel to show any new tags added from logic blocks
+        if hasattr(self.variable_panel, 'update_tag_tree'):
+            self.variable_panel.update_tag_tree()
         
-        QTimer.singleShot(0,lambda: self.canvas.ensureVisible(0,0,1,1))
+        # Center the dialog in the main window
+        parent_geom = self.geometry()
+        dlg_geom = self.tag_dialog.frameGeometry()
+        center_point = parent_geom.center()
+        dlg_geom.moveCenter(center_point)
+        self.tag_dialog.move(dlg_geom.topLeft())
+        self.tag_dialog.show()
 
     def show_setup_dialog(self):
         # Pass the variable panel to setup dialog for integration
-        variable_panel = getattr(self, 'variable_panel', None)
-        dlg = SetupDialog(self, variable_panel)
+        variable_panel = self._ensure_variable_panel()
+        if self._setup_dialog_cls is None:
+            from editor.setup_dialog import SetupDialog
+            self._setup_dialog_cls = SetupDialog
+        dlg = self._setup_dialog_cls(self, variable_panel)
         dlg.exec()
 
-    def on_external_tag_added(self, tag_name):
-        """Called when a tag is added to TagManager from logic blocks"""
-        # Refresh the main window's variable panel to show the new tag
-        if hasattr(self.variable_panel, 'on_external_tag_added'):
-            self.variable_panel.on_external_tag_added(tag_name)
+    def _queue_external_tag(self, tag_name):
+        """Remember a tag added from logic blocks before the variable panel exists"""
+        self._pending_external_tags.append(tag_name)
 
     def refresh_block_config(self):
         """Reload block configuration from JSON file"""
         # Refresh the toolbox
-        toolbox_widget = self.td.widget()
+        toolbox_widget = self._ensure_toolbox().widget()
         if toolbox_widget:
             # Duck typing: if it has the method, call it
             refresh_method = getattr(toolbox_widget, 'refresh_toolbox', None)
@@ -211,13 +323,7 @@ class MainWindow(QMainWindow):
         self.show_values_action.setEnabled(debug_enabled)
         
         # Update all logic blocks in the canvas
-        if self.canvas and self.canvas.scene():
-            scene = self.canvas.scene()
-            if scene:
-                from editor.logic_blocks import LogicBlock
-                for item in scene.items():
-                    if isinstance(item, LogicBlock):
-                        item.toggle_debug_mode(debug_enabled)
+        self.canvas.debug_mode_changed.emit(debug_enabled)
         
         if debug_enabled:
             print("Debug mode enabled - logic blocks will show configuration details")
@@ -228,13 +334,7 @@ class MainWindow(QMainWindow):
 
     def toggle_show_values(self):
         """Toggle between showing tag names and values in debug mode"""
-        if self.canvas and self.canvas.scene():
-            scene = self.canvas.scene()
-            if scene:
-                from editor.logic_blocks import LogicBlock
-                for item in scene.items():
-                    if isinstance(item, LogicBlock):
-                        item.toggle_value_display()
+        self.canvas.show_values_toggled.emit()
         
         if self.show_values_action.isChecked():
             print("Showing tag values in logic blocks")
@@ -258,31 +358,33 @@ class MainWindow(QMainWindow):
         project_name, project_path = project_info
 
         try:
-            # Clear the canvas and reset tags
+            # Clear the canvas, scroll to A1 and reset tags
             self.canvas.clear_canvas()
+            self.canvas.ensureVisible(0,0,1,1)
             
             # Clear software tags for new project (keep only hardware I/O)
-            from editor.tag_integration import tag_manager
-            if tag_manager:
+            if tag_manager is not None:
                 tag_manager.clear_software_tags()
             
-            # Reset the variable panel
-            if hasattr(self, 'variable_panel'):
+            # Reset the variable panel (deferred until it is built)
+            if self.variable_panel is not None:
                 self._reset_variable_panel()
                 # Refresh to show only hardware tags
                 if hasattr(self.variable_panel, 'auto_load_tags'):
                     self.variable_panel.auto_load_tags()
+            else:
+                self._variable_panel_reset_pending = True
             
             # Set the new project file path
             self.current_project_file = project_path
-            self.project_modified = False
+            self._set_project_clean()
             
             # Update window title with project name
-            self.setWindowTitle(f"Embedded PLC Flowchart GUI - {project_name}")
+            self._set_title(f"Embedded PLC Flowchart GUI - {project_name}[*]")
             
             # Update solution panel if it exists
-            if hasattr(self, 'pd') and self.pd.widget():
-                project_panel = self.pd.widget()
+            if self._pd is not None and self._pd.widget():
+                project_panel = self._pd.widget()
                 # Use duck typing to check if the method exists
                 if hasattr(project_panel, 'update_project_name'):
                     try:
@@ -304,8 +406,7 @@ class MainWindow(QMainWindow):
 
     def _get_new_project_info(self):
         """Get project name and location from user"""
-        from PyQt6.QtWidgets import QInputDialog, QFileDialog
-        import os
+        from PyQt6.QtWidgets import QInputDialog
         
         # Get project name
         project_name, ok = QInputDialog.getText(
@@ -321,10 +422,11 @@ class MainWindow(QMainWindow):
         project_name = project_name.strip()
         
         # Get project location
-        project_dir = QFileDialog.getExistingDirectory(
-            self,
+        project_dir = self._run_file_dialog(
             'Select Project Location',
-            os.path.expanduser('~/Documents')
+            QFileDialog.AcceptMode.AcceptOpen,
+            QFileDialog.FileMode.Directory,
+            directory=os.path.expanduser('~/Documents')
         )
         
         if not project_dir:
@@ -337,60 +439,45 @@ class MainWindow(QMainWindow):
 
     def show_startup_dialog(self):
         """Show startup dialog to choose between new project or open existing"""
-        from PyQt6.QtWidgets import QMessageBox
-        
-        msg = QMessageBox(self)
-        msg.setWindowTitle("ESP32 PLC GUI - Project Selection")
-        msg.setText("Welcome to ESP32 PLC GUI")
-        msg.setInformativeText("Would you like to create a new project or open an existing one?")
-        msg.setIcon(QMessageBox.Icon.Question)
-        
-        # Custom buttons
-        new_btn = msg.addButton("New Project", QMessageBox.ButtonRole.AcceptRole)
-        open_btn = msg.addButton("Open Existing", QMessageBox.ButtonRole.AcceptRole)
-        cancel_btn = msg.addButton("Skip", QMessageBox.ButtonRole.RejectRole)
+        # Built once and reused if the dialog is shown again
+        if self._startup_dialog is None:
+            self._startup_dialog = StartupChoiceDialog(self)
         
-        msg.setDefaultButton(new_btn)
+        # Execute dialog and handle response (rejected/closed counts as Skip)
+        result = self._startup_dialog.exec()
         
-        # Center the dialog on the main window
-        msg.move(
-            self.geometry().center().x() - msg.width() // 2,
-            self.geometry().center().y() - msg.height() // 2
-        )
-        
-        # Execute dialog and handle response
-        result = msg.exec()
-        
-        if msg.clickedButton() == new_btn:
+        if result == StartupChoice.NEW_PROJECT:
             self.new_project()
-        elif msg.clickedButton() == open_btn:
+        elif result == StartupChoice.OPEN_PROJECT:
             self.open_project()
-        elif msg.clickedButton() == cancel_btn:
+        else:
             # User skipped - leave with current state but clear software tags
             self._reset_to_empty_project()
 
     def _reset_to_empty_project(self):
         """Reset to an empty project state with no tags"""
         self.canvas.clear_canvas()
+        self.canvas.ensureVisible(0,0,1,1)
         
         # Clear software tags (keep only hardware I/O)
-        from editor.tag_integration import tag_manager
-        if tag_manager:
+        if tag_manager is not None:
             tag_manager.clear_software_tags()
         
-        if hasattr(self, 'variable_panel'):
+        if self.variable_panel is not None:
             self._reset_variable_panel()
             # Refresh to show only hardware tags
             if hasattr(self.variable_panel, 'auto_load_tags'):
                 self.variable_panel.auto_load_tags()
+        else:
+            self._variable_panel_reset_pending = True
                 
         self.current_project_file = None
-        self.project_modified = False
-        self.setWindowTitle("Embedded PLC Flowchart GUI - Untitled Project")
+        self._set_project_clean()
+        self._set_title("Embedded PLC Flowchart GUI - Untitled Project[*]")
         
         # Update solution panel with default name
-        if hasattr(self, 'pd') and self.pd.widget():
-            project_panel = self.pd.widget()
+        if self._pd is not None and self._pd.widget():
+            project_panel = self._pd.widget()
             if hasattr(project_panel, 'update_project_name'):
                 try:
                     project_panel.update_project_name("Untitled Project")  # type: ignore
@@ -407,6 +494,8 @@ class MainWindow(QMainWindow):
         Returns:
             True if user confirms or no unsaved changes, False if user cancels
         """
+        # Apply any modification still waiting on the coalescing timer
+        self._flush_modified()
         if not self.project_modified:
             return True
         
@@ -421,23 +510,30 @@ class MainWindow(QMainWindow):
 
     def _reset_variable_panel(self):
         """Reset the variable panel to default state"""
+        vp = self.variable_panel
+        # Rebuild every table in one pass: no repaints or tags_modified until done
+        vp.setUpdatesEnabled(False)
+        vp.blockSignals(True)
         try:
             # Clear existing tags and reload default configuration
-            self.variable_panel.physical_table.setRowCount(0)
-            self.variable_panel.software_table.setRowCount(0)
+            vp.physical_table.setRowCount(0)
+            vp.software_table.setRowCount(0)
             
             # Import and reset memory allocator
             from editor.variable_panel import ESP32MemoryAllocator
-            self.variable_panel.memory_allocator = ESP32MemoryAllocator()
+            vp.memory_allocator = ESP32MemoryAllocator()
             
-            self.variable_panel.populate_physical_io_table()
-            self.variable_panel.populate_hardware_registers_table()
-            self.variable_panel.update_tag_tree()
-            self.variable_panel.update_memory_overview()
+            vp.populate_physical_io_table()
+            vp.populate_hardware_registers_table()
+            vp.update_tag_tree()
+            vp.update_memory_overview()
             
         except Exception as e:
             self.logger.warning(f"Failed to reset variable panel: {e}")
             # Don't fail the entire operation for variable panel issues
+        finally:
+            vp.blockSignals(False)
+            vp.setUpdatesEnabled(True)
 
     @log_method_entry
     def open_project(self):
@@ -471,13 +567,12 @@ class MainWindow(QMainWindow):
 
     def _get_project_file_path(self) -> str:
         """Get project file path from user via file dialog"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, 
-            'Open Project', 
-            '', 
-            'PLC Project Files (*.plc);;JSON Files (*.json);;All Files (*)'
+        return self._run_file_dialog(
+            'Open Project',
+            QFileDialog.AcceptMode.AcceptOpen,
+            QFileDialog.FileMode.ExistingFile,
+            PROJECT_FILE_FILTER
         )
-        return file_path
 
     def _load_project_data(self, file_path: str) -> dict:
         """
@@ -496,8 +591,12 @@ class MainWindow(QMainWindow):
         # Validate file path and readability
         validate_file_path(file_path, check_exists=True, check_readable=True)
         
-        # Load and validate JSON
-        project_data = validate_json_file(file_path)
+        # .plc zip containers are read section by section; plain JSON files
+        # are parsed straight from a memory-mapped file
+        if is_project_container(file_path):
+            project_data = read_project_container(file_path)
+        else:
+            project_data = load_mapped_json_file(file_path)
         
         # Validate project data structure
         validate_project_data(project_data)
@@ -513,18 +612,19 @@ class MainWindow(QMainWindow):
             file_path: Path to the project file
         """
         try:
-            # Load project data into canvas
+            # Load project data into canvas and scroll to A1
             self.canvas.load_project(project_data)
+            self.canvas.ensureVisible(0,0,1,1)
             
             # Load tag configuration if available
-            if hasattr(self, 'variable_panel') and 'tags_configuration' in project_data:
-                self.variable_panel.load_tag_configuration(project_data['tags_configuration'])
+            if 'tags_configuration' in project_data:
+                self._ensure_variable_panel().load_tag_configuration(project_data['tags_configuration'])
             
             # Update application state
             self.current_project_file = file_path
-            self.project_modified = False
+            self._set_project_clean()
             filename = os.path.basename(file_path)
-            self.setWindowTitle(f"Embedded PLC Flowchart GUI - {filename}")
+            self._set_title(f"Embedded PLC Flowchart GUI - {filename}[*]")
             
         except Exception as e:
             raise ProjectDataError(f"Failed to apply project data: {e}")
@@ -552,13 +652,47 @@ class MainWindow(QMainWindow):
 
     def _get_save_file_path(self) -> str:
         """Get save file path from user via file dialog"""
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, 
-            'Save Project As', 
-            '', 
-            'PLC Project Files (*.plc);;JSON Files (*.json);;All Files (*)'
+        return self._run_file_dialog(
+            'Save Project As',
+            QFileDialog.AcceptMode.AcceptSave,
+            QFileDialog.FileMode.AnyFile,
+            PROJECT_FILE_FILTER
         )
-        return file_path
+
+    def _run_file_dialog(self, title: str, accept_mode, file_mode,
+                         name_filter: str = None, directory: str = None) -> str:
+        """
+        Show the shared file dialog configured for one request
+        
+        The dialog is created once and reused. It skips custom directory icons
+        and symlink resolution, which keeps browsing slow/network folders fast.
+        
+        Returns:
+            Selected path, or an empty string if the dialog was cancelled
+        """
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self)
+            self._file_dialog.setOptions(
+                QFileDialog.Option.DontUseCustomDirectoryIcons |
+                QFileDialog.Option.DontResolveSymlinks
+            )
+        dlg = self._file_dialog
+        dlg.setWindowTitle(title)
+        dlg.setAcceptMode(accept_mode)
+        dlg.setFileMode(file_mode)
+        dlg.setOption(QFileDialog.Option.ShowDirsOnly,
+                      file_mode == QFileDialog.FileMode.Directory)
+        if name_filter:
+            dlg.setNameFilter(name_filter)
+        if directory is not None:
+            dlg.setDirectory(directory)
+        # Clear the previous selection so it is not offered again
+        dlg.selectFile('')
+
+        if dlg.exec() != QDialog.DialogCode.Accepted:
+            return ''
+        selected = dlg.selectedFiles()
+        return selected[0] if selected else ''
 
     def _save_to_file(self, file_path: str) -> bool:
         """
@@ -579,11 +713,11 @@ class MainWindow(QMainWindow):
             if directory and not os.access(directory, os.W_OK):
                 raise ProjectFileError(f"Directory is not writable: {directory}")
             
-            # Prepare project data
-            project_data = self._prepare_project_data()
+            # Prepare the sections that do not come from the canvas
+            extra_sections = self._prepare_project_data()
             
-            # Save to file with proper encoding and error handling
-            self._write_project_file(file_path, project_data)
+            # Stream the canvas and extra sections to file
+            self._write_project_file(file_path, extra_sections)
             
             # Update application state
             self._update_save_state(file_path)
@@ -602,21 +736,22 @@ class MainWindow(QMainWindow):
 
     def _prepare_project_data(self) -> dict:
         """
-        Prepare project data for saving
+        Prepare the non-canvas project sections for saving
+        
+        The canvas blocks and wires are streamed separately by
+        FlowchartCanvas.stream_project_data.
         
         Returns:
-            Complete project data dictionary
+            Dictionary with 'tags_configuration' and 'metadata'
             
         Raises:
             ProjectDataError: If data preparation fails
         """
         try:
-            # Get project data from canvas
-            project_data = self.canvas.get_project_data()
+            project_data = {}
             
-            # Add tag configuration if variable panel exists
-            if hasattr(self, 'variable_panel'):
-                project_data['tags_configuration'] = self.variable_panel.get_tag_configuration()
+            # Add tag configuration (builds the variable panel if needed)
+            project_data['tags_configuration'] = self._ensure_variable_panel().get_tag_configuration()
             
             # Add metadata
             project_data['metadata'] = {
@@ -631,163 +766,97 @@ class MainWindow(QMainWindow):
         except Exception as e:
             raise ProjectDataError(f"Failed to prepare project data: {e}")
 
-    def _write_project_file(self, file_path: str, project_data: dict):
+    def _write_project_file(self, file_path: str, extra_sections: dict):
         """
-        Write project data to file with proper error handling
+        Stream the project to file with proper error handling
         
         Args:
             file_path: Path to write the file
-            project_data: Project data to write
+            extra_sections: Top-level sections appended after the canvas data
             
         Raises:
             ProjectFileError: If file write operation fails
         """
+        # Write to a temporary file first so a crash never leaves a partial project
+        tmp_path = file_path + ".tmp"
         try:
-            # Use context manager for proper file handling
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(project_data, f, indent=2, ensure_ascii=False)
+            # A large buffer turns the per-block/per-wire writes into a few big syscalls
+            with open(tmp_path, 'wb', buffering=SAVE_BUFFER_SIZE) as f:
+                if file_path.lower().endswith('.plc'):
+                    # .plc files are zip containers with one entry per section
+                    write_project_container(f, self._project_sections(extra_sections))
+                else:
+                    self.canvas.stream_project_data(f.write, extra_sections)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
                 
         except PermissionError:
+            self._discard_temp_file(tmp_path)
             raise ProjectFileError(f"Permission denied writing to file: {file_path}")
         except OSError as e:
+            self._discard_temp_file(tmp_path)
             raise ProjectFileError(f"OS error writing file {file_path}: {e}")
         except (TypeError, ValueError) as e:
+            self._discard_temp_file(tmp_path)
             raise ProjectFileError(f"JSON serialization error: {e}")
 
+    def _project_sections(self, extra_sections: dict):
+        """Yield (name, stream) pairs for every project section"""
+        items = self.canvas.scene_items_by_kind()
+        for section in self.canvas.PROJECT_SECTIONS:
+            yield section, lambda write, section=section: self.canvas.stream_section(write, section, items)
+        for key, value in extra_sections.items():
+            yield key, lambda write, value=value: write(json_io.dumps(value))
+
+    @staticmethod
+    def _discard_temp_file(tmp_path: str):
+        """Remove a leftover temporary save file, ignoring errors"""
+        try:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        except OSError:
+            pass
+
+    def _set_project_clean(self):
+        """Clear the modified flag and drop any pending modification"""
+        self._dirty_timer.stop()
+        self._pending_modified = False
+        self.project_modified = False
+        self.setWindowModified(False)
+
+    def _set_title(self, title: str):
+        """Set the window title, skipping the update when it is unchanged"""
+        if title != self._last_title:
+            self._last_title = title
+            self.setWindowTitle(title)
+
     def _update_save_state(self, file_path: str):
         """Update application state after successful save"""
         self.current_project_file = file_path
-        self.project_modified = False
+        self._set_project_clean()
         filename = os.path.basename(file_path)
-        self.setWindowTitle(f"Embedded PLC Flowchart GUI - {filename}")
+        self._set_title(f"Embedded PLC Flowchart GUI - {filename}[*]")
 
     @log_method_entry
     def mark_project_modified(self):
-        """Mark the project as modified with logging"""
+        """Schedule the project to be marked as modified"""
+        self._pending_modified = True
+        if not self._dirty_timer.isActive():
+            self._dirty_timer.start()
+
+    def _flush_modified(self):
+        """Apply a pending modification once per burst of edits"""
+        self._dirty_timer.stop()
+        if not self._pending_modified:
+            return
+        self._pending_modified = False
         if not self.project_modified:
             self.project_modified = True
-            title = self.windowTitle()
-            if not title.endswith('*'):
-                self.setWindowTitle(title + '*')
+            # Qt renders the '[*]' title placeholder as an asterisk
+            self.setWindowModified(True)
             self.logger.debug("Project marked as modified")
 
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    
-    # Set global application stylesheet to fix highlighting issues
-    global_style = """
-    QTableWidget {
-        selection-background-color: #3daee9;
-        selection-color: white;
-        alternate-background-color: #f0f0f0;
-        gridline-color: #d0d0d0;
-        background-color: white;
-        color: black;
-    }
-    
-    QTableWidget::item:selected {
-        background-color: #3daee9;
-        color: white;
-    }
-    
-    QTableWidget::item:hover {
-        background-color: #e0f0ff;
-        color: black;
-    }
-    
-    QTreeWidget {
-        selection-background-color: #3daee9;
-        selection-color: white;
-        alternate-background-color: #f0f0f0;
-        background-color: white;
-        color: black;
-    }
-    
-    QTreeWidget::item:selected {
-        background-color: #3daee9;
-        color: white;
-    }
-    
-    QTreeWidget::item:hover {
-        background-color: #e0f0ff;
-        color: black;
-    }
-    
-    QComboBox {
-        selection-background-color: #3daee9;
-        selection-color: white;
-        background-color: white;
-        color: black;
-    }
-    
-    QComboBox QAbstractItemView {
-        selection-background-color: #3daee9;
-        selection-color: white;
-        background-color: white;
-        color: black;
-    }
-    
-    QComboBox QAbstractItemView::item:selected {
-        background-color: #3daee9;
-        color: white;
-    }
-    
-    QComboBox QAbstractItemView::item:hover {
-        background-color: #e0f0ff;
-        color: black;
-    }
-    
-    QListWidget {
-        selection-background-color: #3daee9;
-        selection-color: white;
-        alternate-background-color: #f0f0f0;
-        background-color: white;
-        color: black;
-    }
-    
-    QListWidget::item:selected {
-        background-color: #3daee9;
-        color: white;
-    }
-    
-    QListWidget::item:hover {
-        background-color: #e0f0ff;
-        color: black;
-    }
-    
-    QLineEdit:focus {
-        border: 2px solid #3daee9;
-        background-color: white;
-        color: black;
-    }
-    
-    QTextEdit:focus {
-        border: 2px solid #3daee9;
-        background-color: white;
-        color: black;
-    }
-    
-    QTabWidget::pane {
-        border: 1px solid #c0c0c0;
-        background-color: white;
-    }
-    
-    QTabBar::tab:selected {
-        background-color: #3daee9;
-        color: white;
-    }
-    
-    QTabBar::tab:hover {
-        background-color: #e0f0ff;
-        color: black;
-    }
-    """
-    app.setStyleSheet(global_style)
-    
-    win = MainWindow()
-    win.show()
-    sys.exit(app.exec())
-
 def main():
     """Entry point for console script with comprehensive error handling"""
     logger = get_logger('Main')
@@ -795,117 +864,15 @@ def main():
     try:
         logger.info("Starting ESP32 PLC GUI application")
         
+        # Coalesce mouse-move/resize bursts (block and wire drags) into one event per
+        # dispatch, and keep native window handles from spreading to sibling widgets
+        QApplication.setAttribute(Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents, True)
+        QApplication.setAttribute(Qt.ApplicationAttribute.AA_DontCreateNativeWidgetSiblings, True)
         app = QApplication(sys.argv)
         
-        # Set global application stylesheet to fix highlighting issues
-        global_style = """
-        QTableWidget {
-            selection-background-color: #3daee9;
-            selection-color: white;
-            alternate-background-color: #f0f0f0;
-            gridline-color: #d0d0d0;
-            background-color: white;
-            color: black;
-        }
-        
-        QTableWidget::item:selected {
-            background-color: #3daee9;
-            color: white;
-        }
-        
-        QTableWidget::item:hover {
-            background-color: #e0f0ff;
-            color: black;
-        }
-        
-        QTreeWidget {
-            selection-background-color: #3daee9;
-            selection-color: white;
-            alternate-background-color: #f0f0f0;
-            background-color: white;
-            color: black;
-        }
-        
-        QTreeWidget::item:selected {
-            background-color: #3daee9;
-            color: white;
-        }
-        
-        QTreeWidget::item:hover {
-            background-color: #e0f0ff;
-            color: black;
-        }
-        
-        QComboBox {
-            selection-background-color: #3daee9;
-            selection-color: white;
-            background-color: white;
-            color: black;
-        }
-        
-        QComboBox QAbstractItemView {
-            selection-background-color: #3daee9;
-            selection-color: white;
-            background-color: white;
-            color: black;
-        }
-        
-        QComboBox QAbstractItemView::item:selected {
-            background-color: #3daee9;
-            color: white;
-        }
-        
-        QComboBox QAbstractItemView::item:hover {
-            background-color: #e0f0ff;
-            color: black;
-        }
-        
-        QListWidget {
-            selection-background-color: #3daee9;
-            selection-color: white;
-            alternate-background-color: #f0f0f0;
-            background-color: white;
-            color: black;
-        }
-        
-        QListWidget::item:selected {
-            background-color: #3daee9;
-            color: white;
-        }
-        
-        QListWidget::item:hover {
-            background-color: #e0f0ff;
-            color: black;
-        }
-        
-        QLineEdit:focus {
-            border: 2px solid #3daee9;
-            background-color: white;
-            color: black;
-        }
-        
-        QTextEdit:focus {
-            border: 2px solid #3daee9;
-            background-color: white;
-            color: black;
-        }
-        
-        QTabWidget::pane {
-            border: 1px solid #c0c0c0;
-            background-color: white;
-        }
-        
-        QTabBar::tab:selected {
-            background-color: #3daee9;
-            color: white;
-        }
-        
-        QTabBar::tab:hover {
-            background-color: #e0f0ff;
-            color: black;
-        }
-        """
-        app.setStyleSheet(global_style)
+        # Selection colors come from the palette, the rest from the global stylesheet
+        apply_global_palette(app)
+        app.setStyleSheet(load_global_stylesheet())
         
         # Create and show main window
         win = MainWindow()
@@ -1,13 +1,20 @@
 from PyQt6.QtWidgets import QGraphicsPathItem, QGraphicsItem
 from PyQt6.QtGui import QPainterPath, QPen, QColor
 from PyQt6.QtCore import Qt, QPointF
-import math
+from math import hypot
+
+# Radius for rounded wire corners
+CORNER_RADIUS = 15
 
 class AutoRoutedWire(QGraphicsPathItem):
     def __init__(self, start_point, end_point, parent=None):
         super().__init__(parent)
         self.start_point = start_point
         self.end_point = end_point
+        # False while the path is a straight drag-time placeholder
+        self._routed = False
+        # Qt strokes the path anew on every shape() call; see shape()
+        self._shape = None
         self.setPen(QPen(QColor("black"), 3))
         self.setFlags(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable)
         self.setZValue(2)
@@ -31,120 +38,91 @@ class AutoRoutedWire(QGraphicsPathItem):
         end = self.end_point
         
         # Calculate the routing path
-        dx = end.x() - start.x()
-        dy = end.y() - start.y()
-        
-        # Minimum routing distance to avoid too sharp turns
-        min_route_distance = 30
-        corner_radius = 15  # Radius for rounded corners
+        sx, sy = start.x(), start.y()
+        ex, ey = end.x(), end.y()
+        dx = ex - sx
+        dy = ey - sy
+        abs_dx = abs(dx)
+        abs_dy = abs(dy)
         
+        path.moveTo(start)
         # If points are too close or aligned, use direct line
-        if abs(dx) < 10 and abs(dy) < 10:
-            path.moveTo(start)
-            path.lineTo(end)
-        elif abs(dx) < 10:  # Vertically aligned
-            path.moveTo(start)
-            path.lineTo(end)
-        elif abs(dy) < 10:  # Horizontally aligned
-            path.moveTo(start)
+        if abs_dx < 10 or abs_dy < 10:
             path.lineTo(end)
+        elif abs_dx > abs_dy:
+            # Route horizontally first, turning 60% of the way
+            mid_x = sx + dx * 0.6
+            self._add_rounded_path(path, start, QPointF(mid_x, sy),
+                                   QPointF(mid_x, ey), end, CORNER_RADIUS)
         else:
-            # Create L-shaped or Z-shaped routing
-            path.moveTo(start)
-            
-            # Determine routing strategy based on relative positions
-            if abs(dx) > abs(dy):
-                # Route horizontally first
-                mid_x = start.x() + dx * 0.6  # 60% of the way
-                mid_point1 = QPointF(mid_x, start.y())
-                mid_point2 = QPointF(mid_x, end.y())
-                
-                # Add rounded corners
-                self._add_rounded_path(path, start, mid_point1, mid_point2, end, corner_radius)
-            else:
-                # Route vertically first
-                mid_y = start.y() + dy * 0.6  # 60% of the way
-                mid_point1 = QPointF(start.x(), mid_y)
-                mid_point2 = QPointF(end.x(), mid_y)
-                
-                # Add rounded corners
-                self._add_rounded_path(path, start, mid_point1, mid_point2, end, corner_radius)
+            # Route vertically first, turning 60% of the way
+            mid_y = sy + dy * 0.6
+            self._add_rounded_path(path, start, QPointF(sx, mid_y),
+                                   QPointF(ex, mid_y), end, CORNER_RADIUS)
         
         self.setPath(path)
+        self._routed = True
+
+    def setPath(self, path):
+        self._shape = None
+        super().setPath(path)
+
+    def setPen(self, pen):
+        self._shape = None
+        super().setPen(pen)
+
+    def shape(self):
+        """Stroked outline used for hit-tests, cached until the path or pen changes"""
+        if self._shape is None:
+            self._shape = super().shape()
+        return self._shape
 
     def _add_rounded_path(self, path, p1, p2, p3, p4, radius):
         """Add a path with rounded corners between four points"""
-        # Early return for segments too short for rounded corners
-        if (p2 - p1).manhattanLength() <= radius * 2:
-            path.lineTo(p2)
-            path.lineTo(p3)
-            path.lineTo(p4)
-            return
-            
-        # Calculate direction and length for first segment
-        direction = p2 - p1
-        length = math.sqrt(direction.x()**2 + direction.y()**2)
-        # Early return if no valid direction
-        if length <= 0:
-            path.lineTo(p2)
-            path.lineTo(p3)
-            path.lineTo(p4)
-            return
-            
-        # Calculate first corner
-        unit_dir = QPointF(direction.x() / length, direction.y() / length)
-        corner_start = QPointF(p2.x() - unit_dir.x() * radius, p2.y() - unit_dir.y() * radius)
-        path.lineTo(corner_start)
-        
-        # Early return if second segment too short for rounding
-        if (p3 - p2).manhattanLength() <= radius * 2:
-            path.lineTo(p2)
-            path.lineTo(p3)
-            path.lineTo(p4)
-            return
-            
-        # Calculate direction and length for second segment
-        direction2 = p3 - p2
-        length2 = math.sqrt(direction2.x()**2 + direction2.y()**2)
-        # Early return if no valid direction
-        if length2 <= 0:
+        x2, y2 = p2.x(), p2.y()
+        x3, y3 = p3.x(), p3.y()
+        dx1, dy1 = x2 - p1.x(), y2 - p1.y()
+        dx2, dy2 = x3 - x2, y3 - y2
+        dx3, dy3 = p4.x() - x3, p4.y() - y3
+        min_length = radius * 2
+
+        # Segments too short for rounded corners fall back to straight lines
+        if abs(dx1) + abs(dy1) <= min_length or abs(dx2) + abs(dy2) <= min_length:
             path.lineTo(p2)
             path.lineTo(p3)
             path.lineTo(p4)
             return
-            
-        # Create first rounded corner
-        unit_dir2 = QPointF(direction2.x() / length2, direction2.y() / length2)
-        corner_end = QPointF(p2.x() + unit_dir2.x() * radius, p2.y() + unit_dir2.y() * radius)
-        path.quadTo(p2, corner_end)
-        
-        # Early return if third segment too short for rounding
-        if (p4 - p3).manhattanLength() <= radius * 2:
-            path.lineTo(p3)
-            path.lineTo(p4)
-            return
-            
-        # Calculate direction and length for third segment
-        direction3 = p4 - p3
-        length3 = math.sqrt(direction3.x()**2 + direction3.y()**2)
-        # Early return if no valid direction
-        if length3 <= 0:
+
+        # First rounded corner at p2
+        scale1 = radius / hypot(dx1, dy1)
+        scale2 = radius / hypot(dx2, dy2)
+        ux2, uy2 = dx2 * scale2, dy2 * scale2
+        path.lineTo(QPointF(x2 - dx1 * scale1, y2 - dy1 * scale1))
+        path.quadTo(p2, QPointF(x2 + ux2, y2 + uy2))
+
+        # Second corner at p3 is only rounded if the last segment is long enough
+        if abs(dx3) + abs(dy3) <= min_length:
             path.lineTo(p3)
-            path.lineTo(p4)
-            return
-            
-        # Create second rounded corner
-        unit_dir3 = QPointF(direction3.x() / length3, direction3.y() / length3)
-        corner_start2 = QPointF(p3.x() - unit_dir2.x() * radius, p3.y() - unit_dir2.y() * radius)
-        path.lineTo(corner_start2)
-        
-        # Final rounded corner
-        corner_end2 = QPointF(p3.x() + unit_dir3.x() * radius, p3.y() + unit_dir3.y() * radius)
-        path.quadTo(p3, corner_end2)
+        else:
+            scale3 = radius / hypot(dx3, dy3)
+            path.lineTo(QPointF(x3 - ux2, y3 - uy2))
+            path.quadTo(p3, QPointF(x3 + dx3 * scale3, y3 + dy3 * scale3))
         path.lineTo(p4)
 
     def update_endpoints(self, start_point, end_point):
         """Update the wire endpoints and regenerate the path"""
+        # Nothing moved: keep the current path and the scene index untouched
+        if self._routed and self.start_point == start_point and self.end_point == end_point:
+            return
         self.start_point = start_point
         self.end_point = end_point
         self.update_path()
+
+    def update_endpoints_fast(self, start_point, end_point):
+        """Move the endpoints and draw a straight line; update_endpoints() routes it later"""
+        self.start_point = start_point
+        self.end_point = end_point
+        self._routed = False
+        path = QPainterPath(start_point)
+        path.lineTo(end_point)
+        self.setPath(path)
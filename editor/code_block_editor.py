@@ -1,4 +1,5 @@
-from PyQt6.QtWidgets import QDialog, QVBoxLayout, QTextEdit, QPushButton, QHBoxLayout
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QPlainTextEdit, QPushButton, QHBoxLayout
+from PyQt6.QtGui import QFontDatabase
 
 class CodeBlockEditor(QDialog):
     def __init__(self, initial_code="", parent=None):
@@ -6,7 +7,10 @@ class CodeBlockEditor(QDialog):
         self.setWindowTitle("Edit Code Block")
         self.resize(600, 400)
         layout = QVBoxLayout(self)
-        self.text_edit = QTextEdit(self)
+        # Plain-text editor: line-based layout, no rich-text formatting state
+        self.text_edit = QPlainTextEdit(self)
+        self.text_edit.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.text_edit.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
         self.text_edit.setPlainText(initial_code)
         layout.addWidget(self.text_edit)
         btn_layout = QHBoxLayout()
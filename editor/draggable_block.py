@@ -2,27 +2,35 @@
 
 # Place StartBlock definition after DraggableBlock
 
-from PyQt6.QtWidgets import QPushButton
+import itertools
+
+from PyQt6.QtWidgets import QPushButton, QGraphicsEllipseItem, QGraphicsItem
+from PyQt6.QtGui import QColor, QPen, QBrush, QDrag
+from PyQt6.QtCore import Qt, QPointF, QTimer, QRectF, QMimeData
 
 # Minimal DraggableButton implementation for Toolbox
 class DraggableButton(QPushButton):
+    # Squared distance (px^2) the mouse must travel before a drag starts
+    _drag_threshold_sq = 100
+
     def __init__(self, text, parent=None):
         super().__init__(text, parent)
         self.setAcceptDrops(False)
         self._drag_start_pos = None
 
     def mousePressEvent(self, e):
-        from PyQt6.QtCore import Qt
         if e is not None and hasattr(e, 'button') and e.button() == Qt.MouseButton.LeftButton:
             if hasattr(e, 'pos') and e.pos() is not None:
                 self._drag_start_pos = e.pos()
         super().mousePressEvent(e)
 
     def mouseMoveEvent(self, a0):
-        if a0 is not None and hasattr(a0, 'pos') and a0.pos() is not None and self._drag_start_pos is not None:
-            if (a0.pos() - self._drag_start_pos).manhattanLength() > 10:
-                from PyQt6.QtGui import QDrag
-                from PyQt6.QtCore import QMimeData
+        start = self._drag_start_pos
+        if start is not None and a0 is not None:
+            pos = a0.pos()
+            dx = pos.x() - start.x()
+            dy = pos.y() - start.y()
+            if dx * dx + dy * dy > self._drag_threshold_sq:
                 drag = QDrag(self)
                 mime = QMimeData()
                 mime.setText(self.text())
@@ -30,66 +38,166 @@ class DraggableButton(QPushButton):
                 drag.exec()
                 self._drag_start_pos = None
         super().mouseMoveEvent(a0)
-from PyQt6.QtWidgets import QGraphicsRectItem, QGraphicsEllipseItem, QGraphicsTextItem, QGraphicsItem
-from PyQt6.QtGui import QColor, QPen, QBrush
-from PyQt6.QtCore import QPointF, QTimer, QRectF
-from PyQt6.QtCore import QLineF
-from PyQt6.QtCore import Qt
+
+# Port brushes, shared by every block
+_FREE_PORT_BRUSH = QBrush(QColor("darkblue"))
+_HOVER_PORT_BRUSH = QBrush(QColor("lightblue"))
+_INPUT_PORT_BRUSH = QBrush(QColor("orange"))
+_OUTPUT_PORT_BRUSH = QBrush(QColor("green"))
+
+# (port size, block width, block height) -> port layout from _port_origins()
+_port_origin_cache = {}
+
+# One bit per port name; a block's input ports are kept as a mask of these
+_PORT_BITS = {'top': 1, 'left': 2, 'right': 4, 'bottom': 8}
+
+# Blocks whose wires need updating, flushed together by one shared zero-delay
+# timer; a dict keeps insertion order and queues each block at most once
+_pending_wire_blocks = {}
+_wire_flush_timer = None
+
+
+def _schedule_wire_update(block):
+    """Queue a wire update for block, run on the next event-loop pass"""
+    global _wire_flush_timer
+    _pending_wire_blocks[block] = None
+    if _wire_flush_timer is None:
+        _wire_flush_timer = QTimer()
+        _wire_flush_timer.setSingleShot(True)
+        _wire_flush_timer.setInterval(0)
+        _wire_flush_timer.timeout.connect(_flush_wire_updates)
+    if not _wire_flush_timer.isActive():
+        _wire_flush_timer.start()
+
+
+def _flush_wire_updates():
+    blocks = list(_pending_wire_blocks)
+    _pending_wire_blocks.clear()
+    for block in blocks:
+        # Skip blocks deleted from the scene since they were queued
+        if block.scene() is None:
+            continue
+        if _drag_active:
+            # Straight wires while the mouse is down; routed once on release
+            _dragged_blocks[block] = None
+            block._update_connected_wires(fast=True)
+        else:
+            block._update_connected_wires()
+
+
+# Set on a block's mouse press and cleared by the canvas on every mouse release
+# (the block itself may never see the release); blocks moved meanwhile are
+# remembered so their wires can be fully routed when the drag ends
+_drag_active = False
+_dragged_blocks = {}
+
+
+def _finish_drag():
+    """Route the wires of every block moved during the drag that just ended"""
+    global _drag_active
+    _drag_active = False
+    blocks = list(_dragged_blocks)
+    _dragged_blocks.clear()
+    for block in blocks:
+        if block.scene() is not None:
+            block._update_connected_wires()
+
+
+# Pen for the block label
+_TEXT_PEN = QPen(QColor(30, 30, 30))
+
+# Dashed outline drawn around selected blocks
+_SELECTED_BLOCK_PEN = QPen(QColor(0, 120, 215), 3, Qt.PenStyle.DashLine)
 
 # PortEllipse definition (add if missing)
 class PortEllipse(QGraphicsEllipseItem):
     def __init__(self, x, y, w, h, parent, which):
         super().__init__(x, y, w, h, parent)
-        self.setBrush(QColor("darkblue"))
+        # brush() returns a new wrapper on every call, so the shared brush
+        # last applied is remembered here and compared by identity
+        self._current_brush = _FREE_PORT_BRUSH
+        self.setBrush(_FREE_PORT_BRUSH)
         self.setZValue(parent.zValue() + 1)
         self.setAcceptHoverEvents(True)
         self.block = parent
         self.which = which
+        # Center in block coordinates; kept in sync by setRect
+        self._local_center = QPointF(x + w / 2, y + h / 2)
+
+    def setRect(self, *args):
+        super().setRect(*args)
+        self._local_center = self.rect().center()
+
+    def scene_center(self):
+        """Return the port's center in scene coordinates"""
+        return self.mapToScene(self._local_center)
 
     def hoverEnterEvent(self, event):
         # Only show hover if port is available (darkblue)
-        current_brush = self.brush()
-        if current_brush.color() == QColor("darkblue"):
-            self.setBrush(QColor("lightblue"))
+        if self._current_brush is _FREE_PORT_BRUSH:
+            self._apply_brush(_HOVER_PORT_BRUSH)
         QGraphicsEllipseItem.hoverEnterEvent(self, event)
 
     def hoverLeaveEvent(self, event):
-        # Restore original color from parent block
-        if hasattr(self.block, 'update_port_colors'):
-            self.block.update_port_colors()
+        # Restore this port's color from the parent block's port state
+        self.restore_brush()
         QGraphicsEllipseItem.hoverLeaveEvent(self, event)
-from PyQt6.QtGui import QColor, QPen
-from PyQt6.QtCore import QPointF, QTimer
 
-from PyQt6.QtWidgets import QGraphicsItem
+    def restore_brush(self):
+        """Set the brush for this port's state: wired input, wired output or available"""
+        block = self.block
+        which = self.which
+        if block.in_wires and block._input_mask & _PORT_BITS[which]:
+            self._apply_brush(_INPUT_PORT_BRUSH)
+        elif block.out_wires and which == block.output_port:
+            self._apply_brush(_OUTPUT_PORT_BRUSH)
+        else:
+            self._apply_brush(_FREE_PORT_BRUSH)
+
+    def _apply_brush(self, brush):
+        """Set one of the shared port brushes, skipping the repaint if it is already set"""
+        if brush is not self._current_brush:
+            self._current_brush = brush
+            self.setBrush(brush)
 
 class DraggableBlock(QGraphicsItem):
     # Context menu and port selection logic removed for simplicity
 
+    # Diameter of the port circles
+    PORT_SIZE = 12
+    # Squared distance (px^2) a block must move before its wires are updated
+    _MOVE_THRESHOLD_SQ = 0.25
+    # Source of the small per-session ids written to project files
+    _uid_counter = itertools.count(1)
+
     def __init__(self, rect=QRectF(0,0,150,40), text="", parent=None):
         super().__init__(parent)
+        # Identifies the block in saved projects; wires refer to it by this id
+        self.uid = next(DraggableBlock._uid_counter)
         self._rect = rect
         self._brush = QBrush(QColor(220, 220, 220))
+        # Position the wires were last updated for
+        self._last_update_pos = QPointF(0, 0)
         self._pen = QPen(QColor(60, 60, 60), 2)
         self.setFlags(QGraphicsItem.GraphicsItemFlag.ItemIsMovable | 
                       QGraphicsItem.GraphicsItemFlag.ItemIsSelectable | 
                       QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges)
-        # Add text label
-        self.text_item = QGraphicsTextItem(text, self)
-        self.text_item.setDefaultTextColor(QColor(30, 30, 30))
-        self._center_text()
+        # Moving a block blits its cached pixmap instead of repainting it
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        # Text label, painted centered in paint()
+        self._text = text
         
         # Four port system: top, left, right, bottom
-        port_size = 12
+        size = self.PORT_SIZE
         self.ports = {
-            'top': PortEllipse(rect.width()/2-port_size/2, -port_size/2, port_size, port_size, self, 'top'),
-            'left': PortEllipse(-port_size/2, rect.height()/2-port_size/2, port_size, port_size, self, 'left'),
-            'right': PortEllipse(rect.width()-port_size/2, rect.height()/2-port_size/2, port_size, port_size, self, 'right'),
-            'bottom': PortEllipse(rect.width()/2-port_size/2, rect.height()-port_size/2, port_size, port_size, self, 'bottom')
+            name: PortEllipse(x, y, size, size, self, name)
+            for name, x, y in self._port_origins(rect)
         }
         
         # Initially all ports are available, none assigned as input/output
-        self.input_ports = set()  # Multiple input ports allowed
+        self._input_mask = 0  # Multiple input ports allowed, one bit each
+        # Input port used when no specific one is requested (first one assigned)
+        self._primary_input = None
         self.output_port = None  # Only one output port allowed
         self.in_wires = []
         self.out_wires = []
@@ -97,14 +205,31 @@ class DraggableBlock(QGraphicsItem):
 
     def update_port_positions(self):
         """Update port positions based on current rect size"""
-        port_size = 12
-        rect = self._rect
-        
-        # Update port positions
-        self.ports['top'].setRect(rect.width()/2-port_size/2, -port_size/2, port_size, port_size)
-        self.ports['left'].setRect(-port_size/2, rect.height()/2-port_size/2, port_size, port_size)
-        self.ports['right'].setRect(rect.width()-port_size/2, rect.height()/2-port_size/2, port_size, port_size)
-        self.ports['bottom'].setRect(rect.width()/2-port_size/2, rect.height()-port_size/2, port_size, port_size)
+        size = self.PORT_SIZE
+        ports = self.ports
+        for name, x, y in self._port_origins(self._rect):
+            ports[name].setRect(x, y, size, size)
+
+    @classmethod
+    def _port_origins(cls, rect):
+        """Return (name, x, y) of each port's top-left corner, centered on the block edges"""
+        width = rect.width()
+        height = rect.height()
+        # Blocks of one type share a size, so pasting or loading many of them
+        # reuses one layout
+        key = (cls.PORT_SIZE, width, height)
+        origins = _port_origin_cache.get(key)
+        if origins is None:
+            half = cls.PORT_SIZE / 2
+            mid_x = width / 2 - half
+            mid_y = height / 2 - half
+            origins = _port_origin_cache[key] = (
+                ('top', mid_x, -half),
+                ('left', -half, mid_y),
+                ('right', width - half, mid_y),
+                ('bottom', mid_x, height - half),
+            )
+        return origins
 
     def set_active_ports(self, in_port, out_port):
         pass  # No port selection
@@ -114,15 +239,27 @@ class DraggableBlock(QGraphicsItem):
         if port_name in self.ports and port_name != self.output_port:
             # If output port is assigned, any remaining port can be input
             # If no output port yet, any port can be first input
-            self.input_ports.add(port_name)
+            self._input_mask |= _PORT_BITS[port_name]
+            if self._primary_input is None:
+                self._primary_input = port_name
             self.update_port_colors()
             return True
         return False
 
+    @property
+    def input_ports(self):
+        """Set of port names currently assigned as inputs"""
+        mask = self._input_mask
+        return {name for name, bit in _PORT_BITS.items() if mask & bit}
+
+    def has_input_port(self, port_name):
+        """Return True if port_name is assigned as an input"""
+        return bool(self._input_mask & _PORT_BITS.get(port_name, 0))
+
     def assign_output_port(self, port_name):
         """Assign the output port - only one output allowed"""
         # Can use any port except already assigned input ports as output
-        if port_name in self.ports and port_name not in self.input_ports:
+        if port_name in self.ports and not self.has_input_port(port_name):
             # If we already have an output port and it's different, 
             # we need to replace it (single output rule)
             self.output_port = port_name
@@ -132,15 +269,16 @@ class DraggableBlock(QGraphicsItem):
 
     def get_available_ports(self):
         """Get list of ports that can still be used"""
-        used_ports = set(self.input_ports)  # Start with all input ports
+        used_mask = self._input_mask  # Start with all input ports
         if self.output_port:
-            used_ports.add(self.output_port)
-        return [name for name in self.ports.keys() if name not in used_ports]
+            used_mask |= _PORT_BITS[self.output_port]
+        return [name for name, bit in _PORT_BITS.items() if not used_mask & bit]
 
     def reset_ports(self):
         """Reset port assignments completely when all wires are removed"""
         if not self.in_wires:
-            self.input_ports.clear()
+            self._input_mask = 0
+            self._primary_input = None
             # When inputs are disconnected, output port can be reassigned to any of the 4 positions
         if not self.out_wires:
             self.output_port = None
@@ -148,31 +286,33 @@ class DraggableBlock(QGraphicsItem):
 
     def remove_input_port(self, port_name):
         """Remove a specific input port when its wire is disconnected"""
-        if port_name in self.input_ports:
-            self.input_ports.discard(port_name)
+        if self.has_input_port(port_name):
+            self._input_mask &= ~_PORT_BITS[port_name]
+            if port_name == self._primary_input:
+                self._primary_input = next(iter(self.input_ports), None)
             self.update_port_colors()
 
+    def set_input_ports(self, port_names):
+        """Replace the input port assignments, e.g. when loading a project"""
+        port_names = [name for name in port_names if name in _PORT_BITS]
+        mask = 0
+        for name in port_names:
+            mask |= _PORT_BITS[name]
+        self._input_mask = mask
+        self._primary_input = port_names[0] if port_names else None
+
     def update_port_colors(self):
-        for name, port in self.ports.items():
-            if name in self.input_ports and self.in_wires:
-                port.setBrush(QColor("orange"))  # Input port with wire
-            elif name == self.output_port and self.out_wires:
-                port.setBrush(QColor("green"))   # Output port with wire
-            else:
-                port.setBrush(QColor("darkblue"))  # Available port
-
-
-    def _center_text(self):
-        """Center text within the block bounds"""
-        if self.text_item:
-            text_bounds = self.text_item.boundingRect()
-            x = (self._rect.width() - text_bounds.width()) / 2
-            y = (self._rect.height() - text_bounds.height()) / 2
-            self.text_item.setPos(x, y)
+        # Each port picks its own brush; hover-leave restores just the one port
+        for port in self.ports.values():
+            port.restore_brush()
+
+    def text(self):
+        """Return the block label"""
+        return self._text
 
     def setText(self, text):
-        self.text_item.setPlainText(text)
-        self._center_text()
+        self._text = text
+        self.update()
 
     def _update_wires(self):
         # TODO: Implement wire update logic if needed
@@ -180,79 +320,102 @@ class DraggableBlock(QGraphicsItem):
 
     def portScenePos(self, which, port_name=None):
         # which: 'in' or 'out', port_name: specific port for input
-        if which == 'in' and port_name and port_name in self.input_ports:
-            port = self.ports.get(port_name)
-            if port:
-                return port.mapToScene(port.rect().center())
-        elif which == 'out' and self.output_port:
-            port = self.ports.get(self.output_port)
-            if port:
-                return port.mapToScene(port.rect().center())
-        elif which == 'in' and self.input_ports and not port_name:
-            # Return first input port if no specific port requested
-            first_input = next(iter(self.input_ports))
-            port = self.ports.get(first_input)
-            if port:
-                return port.mapToScene(port.rect().center())
+        if which == 'out':
+            return self._out_scene_pos()
+        if which == 'in':
+            return self._in_scene_pos(port_name)
         return None
 
+    def _out_scene_pos(self):
+        """Scene position of the output port, or None if none is assigned"""
+        if self.output_port is None:
+            return None
+        return self.ports[self.output_port].scene_center()
+
+    def _in_scene_pos(self, port_name=None):
+        """Scene position of an input port, the primary one if port_name is not given"""
+        if port_name:
+            if not self.has_input_port(port_name):
+                return None
+        else:
+            port_name = self._primary_input
+            if port_name is None:
+                return None
+        return self.ports[port_name].scene_center()
+
     def itemChange(self, change, value):
         """Handle item changes, specifically position changes to update connected wires"""
         result = super().itemChange(change, value)
         
-        # Update wires both during position change and after it completes
-        if change in (QGraphicsItem.GraphicsItemChange.ItemPositionChange, 
-                     QGraphicsItem.GraphicsItemChange.ItemPositionHasChanged):
-            # Use QTimer to defer wire updates to avoid issues during drag operations
-            QTimer.singleShot(0, self._update_connected_wires)
+        # Update wires once the move is applied; the scene is not repainted yet
+        if change == QGraphicsItem.GraphicsItemChange.ItemPositionHasChanged:
+            last = self._last_update_pos
+            dx = value.x() - last.x()
+            dy = value.y() - last.y()
+            # Sub-pixel jitter leaves the wires where they are
+            if dx * dx + dy * dy < self._MOVE_THRESHOLD_SQ:
+                return result
+            self._last_update_pos = value
+            if (self.in_wires or self.out_wires) and self.scene() is not None:
+                # Deferred to avoid issues during drag operations
+                _schedule_wire_update(self)
         
         return result
 
-    def _update_connected_wires(self):
-        """Update all wires connected to this block"""
-        # Import here to avoid circular imports
-        from editor.auto_routed_wire import AutoRoutedWire
-        from editor.wire_segment import WireSegment
+    def mousePressEvent(self, event):
+        global _drag_active
+        if event is not None and event.button() == Qt.MouseButton.LeftButton:
+            _drag_active = True
+        super().mousePressEvent(event)
+
+    def _update_connected_wires(self, fast=False):
+        """
+        Update all wires connected to this block
+        
+        Args:
+            fast: Draw wires as straight lines (used while a drag is in progress)
+        """
+        # Unconnected blocks (the common case while placing blocks) have nothing to do
+        if not self.out_wires and not self.in_wires:
+            return
+        ports = self.ports
+        # Scene position of each of this block's ports, computed once per call
+        port_pos = {}
+
+        def own_port_pos(name):
+            pos = port_pos.get(name)
+            if pos is None:
+                port = ports.get(name)
+                if port is None:
+                    return None
+                pos = port_pos[name] = port.scene_center()
+            return pos
+        
+        # Every wire class initializes from/to block and port and provides
+        # update_endpoints(start, end), so no type dispatch is needed here;
+        # wires without a cheaper drag-time update fall back to it
+        method = 'update_endpoints_fast' if fast else 'update_endpoints'
         
         # Update all outgoing wires (this block is the source)
-        for wire in self.out_wires:
-            if isinstance(wire, AutoRoutedWire):
-                # Get current positions
-                start_pos = self.portScenePos('out')
-                if hasattr(wire, 'to_block') and wire.to_block and hasattr(wire, 'to_port') and wire.to_port:
-                    end_port = wire.to_block.ports.get(wire.to_port)
-                    if end_port and start_pos is not None:
-                        end_pos = end_port.mapToScene(end_port.rect().center())
-                        wire.update_endpoints(start_pos, end_pos)
-            elif isinstance(wire, WireSegment):
-                # Handle legacy WireSegment wires by updating their points
-                start_pos = self.portScenePos('out')
-                if hasattr(wire, 'to_block') and wire.to_block and hasattr(wire, 'to_port') and wire.to_port:
-                    end_port = wire.to_block.ports.get(wire.to_port)
-                    if end_port and start_pos is not None:
-                        end_pos = end_port.mapToScene(end_port.rect().center())
-                        wire.points = [start_pos, end_pos]
-                        wire.update_path()
+        if self.out_wires and self.output_port:
+            out_pos = own_port_pos(self.output_port)
+            if out_pos is not None:
+                for wire in self.out_wires:
+                    end_port = wire.to_block.ports.get(wire.to_port) if wire.to_block else None
+                    if end_port is not None:
+                        update = getattr(wire, method, wire.update_endpoints)
+                        update(out_pos, end_port.scene_center())
         
-        # Update all incoming wires (this block is the destination)
+        # Update all incoming wires (this block is the destination), each at the
+        # input port it is attached to
         for wire in self.in_wires:
-            if isinstance(wire, AutoRoutedWire):
-                # Get current positions
-                if hasattr(wire, 'from_block') and wire.from_block and hasattr(wire, 'from_port') and wire.from_port:
-                    start_port = wire.from_block.ports.get(wire.from_port)
-                    end_pos = self.portScenePos('in')
-                    if start_port and end_pos is not None:
-                        start_pos = start_port.mapToScene(start_port.rect().center())
-                        wire.update_endpoints(start_pos, end_pos)
-            elif isinstance(wire, WireSegment):
-                # Handle legacy WireSegment wires by updating their points
-                if hasattr(wire, 'from_block') and wire.from_block and hasattr(wire, 'from_port') and wire.from_port:
-                    start_port = wire.from_block.ports.get(wire.from_port)
-                    end_pos = self.portScenePos('in')
-                    if start_port and end_pos is not None:
-                        start_pos = start_port.mapToScene(start_port.rect().center())
-                        wire.points = [start_pos, end_pos]
-                        wire.update_path()
+            start_port = wire.from_block.ports.get(wire.from_port) if wire.from_block else None
+            if start_port is None:
+                continue
+            in_pos = own_port_pos(wire.to_port) if wire.to_port else self._in_scene_pos()
+            if in_pos is not None:
+                update = getattr(wire, method, wire.update_endpoints)
+                update(start_port.scene_center(), in_pos)
 
     def boundingRect(self):
         return self._rect
@@ -261,10 +424,13 @@ class DraggableBlock(QGraphicsItem):
         if painter is None:
             return
         radius = 16
+        # One outline pass: the selection pen replaces the normal pen instead of overdrawing it
+        pen = _SELECTED_BLOCK_PEN if self.isSelected() else self._pen
+        # Inset by half the stroke so the outline stays inside boundingRect()
+        inset = pen.widthF() / 2
         painter.setBrush(self._brush)
-        painter.setPen(self._pen)
-        painter.drawRoundedRect(self._rect, radius, radius)
-        if self.isSelected():
-            sel_pen = QPen(QColor(0, 120, 215), 3, Qt.PenStyle.DashLine)
-            painter.setPen(sel_pen)
-            painter.drawRoundedRect(self._rect, radius, radius)
+        painter.setPen(pen)
+        painter.drawRoundedRect(self._rect.adjusted(inset, inset, -inset, -inset), radius, radius)
+        if self._text:
+            painter.setPen(_TEXT_PEN)
+            painter.drawText(self._rect, Qt.AlignmentFlag.AlignCenter, self._text)
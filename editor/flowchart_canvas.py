@@ -1,12 +1,40 @@
-from PyQt6.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsEllipseItem, QGraphicsItem, QGraphicsPathItem, QGraphicsLineItem
-from PyQt6.QtGui import QPainter, QColor, QPen, QKeySequence
+from PyQt6.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsItem, QGraphicsPathItem, QGraphicsLineItem
+from PyQt6.QtGui import QPainter, QColor, QPen, QKeySequence, QSurfaceFormat, QStaticText, QGuiApplication, QOpenGLContext
 from PyQt6.QtCore import Qt, QPointF, QTimer, QLineF, QRectF, pyqtSignal
-import json
 import os
 
-from editor.draggable_block import DraggableBlock
+from editor.draggable_block import DraggableBlock, PortEllipse, _finish_drag
 from editor.wire_segment import WireSegment
 from editor.auto_routed_wire import AutoRoutedWire
+from utils import PLCProjectError, block_config_cache, json_io
+
+# OpenGL viewport is optional; without it the canvas paints with the raster engine
+try:
+    from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+    OPENGL_AVAILABLE = True
+except ImportError:
+    QOpenGLWidget = None
+    OPENGL_AVAILABLE = False
+
+# Set to 1 to paint the canvas through OpenGL instead of the default raster engine
+OPENGL_ENV_VAR = "PLC_GUI_OPENGL"
+
+
+def opengl_viewport_supported():
+    """Check whether the canvas can paint through a QOpenGLWidget viewport.
+
+    OpenGL is opt-in: it is only used when PLC_GUI_OPENGL=1 is set, the
+    platform plugin can show GL surfaces and an OpenGL context can be created.
+
+    Returns:
+        bool: True if the OpenGL viewport should be used
+    """
+    if not OPENGL_AVAILABLE or os.environ.get(OPENGL_ENV_VAR) != "1":
+        return False
+    # Headless platform plugins have no GL surface to present to
+    if QGuiApplication.platformName() in ("offscreen", "minimal"):
+        return False
+    return QOpenGLContext().create()
 
 # Import LogicBlock at module level to avoid runtime import issues
 try:
@@ -17,18 +45,83 @@ except ImportError as e:
     LogicBlock = None
     LOGIC_BLOCKS_AVAILABLE = False
 
+BLOCK_CONFIG_PATH = os.path.join(os.path.dirname(__file__), "..", "templates", "block_config.json")
+
+# Size of block types missing from the configuration
+DEFAULT_BLOCK_SIZE = (150, 40)
+
+# Used when block_config.json is missing or invalid
+FALLBACK_BLOCK_CONFIG = {
+    "block_types": {
+        "Wire Router": {"width": 75, "height": 40},
+        "default": {"width": 150, "height": 40}
+    }
+}
+
+# Text color of the grid's row/column labels
+GRID_LABEL_COLOR = QColor("black")
+
+# Column index -> label, filled as drawBackground() asks for columns
+_column_labels = {}
+
+# Label text -> QStaticText, so each label's layout is computed once and reused
+_grid_label_texts = {}
+
+
+def _grid_label(text):
+    """Return the reusable QStaticText for a grid label"""
+    static = _grid_label_texts.get(text)
+    if static is None:
+        static = _grid_label_texts[text] = QStaticText(text)
+        static.setTextFormat(Qt.TextFormat.PlainText)
+    return static
+
+
+def _column_label(index):
+    """Spreadsheet-style column name for a 1-based index: A..Z, AA, AB, ..."""
+    label = _column_labels.get(index)
+    if label is None:
+        label = ""
+        col = index
+        while col:
+            col, r = divmod(col - 1, 26)
+            label = chr(65 + r) + label
+        _column_labels[index] = label
+    return label
+
+
 class FlowchartCanvas(QGraphicsView):
     # Signal emitted when project is modified
     project_modified = pyqtSignal()
+    # Debug menu state, delivered to every tracked LogicBlock
+    debug_mode_changed = pyqtSignal(bool)
+    show_values_toggled = pyqtSignal()
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self._wire_arrows = {}
         self._dragging_from_port = None
+        # Blocks and connected wires on the scene, kept in sync by _track_block/
+        # _untrack_block and _track_wire/_untrack_wire; dicts keep insertion order
+        self._blocks = {}
+        self._wires = {}
+        # LogicBlocks currently on the scene, kept in sync by _track_block/_untrack_block
+        self._logic_blocks = set()
+        # Edits within one event-loop pass emit project_modified once; the main
+        # window debounces further, so no extra delay is added here
+        self._modified_timer = QTimer(self)
+        self._modified_timer.setSingleShot(True)
+        self._modified_timer.setInterval(0)
+        self._modified_timer.timeout.connect(self.project_modified.emit)
+        # Block type -> (width, height), built from the config in get_block_size()
+        self._block_sizes = {}
+        self._block_sizes_source = None
         
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         self.setDragMode(QGraphicsView.DragMode.RubberBandDrag)
         self.setAcceptDrops(True)
+        if opengl_viewport_supported():
+            self._use_opengl_viewport()
         vp = self.viewport()
         if vp is not None:
             vp.setAcceptDrops(True)
@@ -36,6 +129,8 @@ class FlowchartCanvas(QGraphicsView):
         self.cell_size = 50
         self.cols, self.rows = 78, 130
         self.drawn_cols, self.drawn_rows = 78, 130
+        # (vertical, horizontal) grid lines, rebuilt lazily when the grid grows
+        self._grid_lines = None
         self.pen = QPen(QColor(220, 220, 220))
 
         scene = QGraphicsScene(self)
@@ -45,11 +140,23 @@ class FlowchartCanvas(QGraphicsView):
         )
         self.setScene(scene)
         self.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if OPENGL_AVAILABLE and isinstance(self.viewport(), QOpenGLWidget):
+            # QOpenGLWidget redraws the whole frame on every update, so Qt's
+            # dirty-region bookkeeping would be wasted work
+            self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        else:
+            # Dragged blocks and their wires repaint as one region instead of many small ones
+            self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.BoundingRectViewportUpdate)
+        # The grid only changes when the scene grows, so keep the painted
+        # background in a viewport-sized pixmap; invalidating the background
+        # layer (see _expand_scene) repaints it
+        self.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
+        # Every item sets the pen/brush it paints with, so the save()/restore()
+        # pair Qt wraps around each item's paint() is not needed
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState, True)
         self.setBackgroundBrush(Qt.GlobalColor.white)
 
-        # Ensure scene is initialized before grid/expansion
-        if self.scene() is not None:
-            self._draw_grid()
+        # The grid is painted in drawBackground(), not added as scene items
         self._copy_buffer = []
 
         # Note: Block configuration is loaded dynamically in get_block_size()
@@ -60,6 +167,7 @@ class FlowchartCanvas(QGraphicsView):
         if scene is not None:
             start_block = StartBlock()
             scene.addItem(start_block)
+            self._track_block(start_block)
             cs = self.cell_size
             start_block.setPos(QPointF(cs, cs))
 
@@ -69,31 +177,73 @@ class FlowchartCanvas(QGraphicsView):
         self._wire_points = []
         self._dragging_from: DraggableBlock | None = None
         self._dragging_from_port: str | None = None
+        # Selected blocks being dragged, set on left-button press
+        self._moving_blocks: list[DraggableBlock] = []
+
+    def _use_opengl_viewport(self):
+        """Rasterize the scene on the GPU through a QOpenGLWidget viewport"""
+        gl_widget = QOpenGLWidget()
+        # Multisampling keeps wires and block outlines antialiased under OpenGL
+        fmt = QSurfaceFormat()
+        fmt.setSamples(4)
+        gl_widget.setFormat(fmt)
+        self.setViewport(gl_widget)
 
     def load_block_config(self):
         """Load block configuration from JSON file"""
         try:
-            config_path = os.path.join(os.path.dirname(__file__), "..", "templates", "block_config.json")
-            with open(config_path, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            return block_config_cache.load_block_config(BLOCK_CONFIG_PATH)
+        except PLCProjectError:
             # Fallback configuration if file not found
-            return {
-                "block_types": {
-                    "Wire Router": {"width": 75, "height": 40},
-                    "default": {"width": 150, "height": 40}
-                }
-            }
+            return FALLBACK_BLOCK_CONFIG
 
     def get_block_size(self, block_name):
         """Get the size for a specific block type"""
-        # Load configuration dynamically to pick up JSON file changes
+        return self._current_block_sizes().get(block_name, DEFAULT_BLOCK_SIZE)
+
+    def _current_block_sizes(self):
+        """
+        Return the block type -> (width, height) table for the current config
+        
+        Checks the config file for changes once per call, so loops creating
+        many blocks (paste, project load) fetch the table once and look up
+        each block in it instead of calling get_block_size() per block.
+        """
+        # Load configuration dynamically to pick up JSON file changes; the
+        # cache returns the same dict until the file changes, so the size
+        # table is only rebuilt after an edit
         block_config = self.load_block_config()
-        block_types = block_config.get("block_types", {})
-        if block_name in block_types:
-            config = block_types[block_name]
-            return config.get("width", 150), config.get("height", 40)
-        return 150, 40  # Default size
+        if block_config is not self._block_sizes_source:
+            self._block_sizes = {
+                name: (config.get("width", 150), config.get("height", 40))
+                for name, config in block_config.get("block_types", {}).items()
+            }
+            self._block_sizes_source = block_config
+        return self._block_sizes
+
+    def _track_block(self, item):
+        """Record a block added to the scene in the typed registries"""
+        self._blocks[item] = None
+        if LogicBlock is not None and isinstance(item, LogicBlock) and item not in self._logic_blocks:
+            self._logic_blocks.add(item)
+            self.debug_mode_changed.connect(item.toggle_debug_mode)
+            self.show_values_toggled.connect(item.toggle_value_display)
+
+    def _untrack_block(self, item):
+        """Forget a block removed from the scene"""
+        self._blocks.pop(item, None)
+        if item in self._logic_blocks:
+            self._logic_blocks.discard(item)
+            self.debug_mode_changed.disconnect(item.toggle_debug_mode)
+            self.show_values_toggled.disconnect(item.toggle_value_display)
+
+    def _track_wire(self, wire):
+        """Record a connected wire added to the scene"""
+        self._wires[wire] = None
+
+    def _untrack_wire(self, wire):
+        """Forget a wire removed from the scene"""
+        self._wires.pop(wire, None)
 
     def dragEnterEvent(self, event):
         if event is not None and hasattr(event, 'mimeData'):
@@ -151,35 +301,16 @@ class FlowchartCanvas(QGraphicsView):
         else:
             blk = DraggableBlock(rect)
             blk.setPos(pt - QPointF(75, 20))
-            # Set text by searching for QGraphicsTextItem child
-            from PyQt6.QtWidgets import QGraphicsTextItem
-            text_item = next((c for c in blk.childItems() if isinstance(c, QGraphicsTextItem)), None)
-            if text_item:
-                text_item.setPlainText(text)
-        # Prevent overlap: check if new block would overlap any existing block
-        new_rect = blk.mapRectToScene(blk.boundingRect())
+            blk.setText(text)
         scene = self.scene()
         if scene is None:
             return
-        # Remove overlap prevention - allow blocks to be placed close together
-        # for item in scene.items():
-        #     # Use inverted returns to reduce nesting
-        #     if not isinstance(item, DraggableBlock) or item == blk:
-        #         continue
-        #         
-        #     if not item.mapRectToScene(item.boundingRect()).intersects(new_rect):
-        #         continue
-        #         
-        #     # Find a non-overlapping position nearby
-        #     offset = QPointF(blk.boundingRect().width() + 10, 0)
-        #     pt += offset
-        #     blk.setPos(pt - QPointF(75, 20))
-        #     new_rect = blk.mapRectToScene(blk.boundingRect())
+        # Overlap prevention removed - allow blocks to be placed close together
         scene.addItem(blk)
+        self._track_block(blk)
         blk.setPos(pt - QPointF(75, 20))
         
-        # Emit project modified signal
-        self.project_modified.emit()
+        self._mark_modified()
 
         sr = scene.sceneRect() if scene is not None else QRectF(0,0,1000,1000)
         cs = self.cell_size
@@ -220,32 +351,24 @@ class FlowchartCanvas(QGraphicsView):
         items = scene.items(scene_pt) if scene is not None else []
         
         for it in items:
-            # Skip non-ellipse items
-            if not isinstance(it, QGraphicsEllipseItem):
+            # Skip anything that is not a block port
+            if not isinstance(it, PortEllipse):
                 continue
                 
-            blk = it.parentItem()
+            blk = it.block
             # Skip non-blocks
             if not isinstance(blk, DraggableBlock):
                 continue
                 
-            # Find which port was clicked
-            clicked_port = None
-            for port_name, port in blk.ports.items():
-                if port == it:
-                    clicked_port = port_name
-                    break
-            
-            # Skip if no port found
-            if not clicked_port:
-                continue
+            # Each port knows its own name
+            clicked_port = it.which
                 
             # Check if this port already has a wire connected and user wants to delete it
-            if (clicked_port == blk.output_port and blk.out_wires) or (clicked_port in blk.input_ports and blk.in_wires):
+            if (clicked_port == blk.output_port and blk.out_wires) or (blk.has_input_port(clicked_port) and blk.in_wires):
                 # Delete existing wire by clicking on connected port
                 if clicked_port == blk.output_port and blk.out_wires:
                     self._disconnect_wire(blk.out_wires[0])
-                elif clicked_port in blk.input_ports and blk.in_wires:
+                elif blk.has_input_port(clicked_port) and blk.in_wires:
                     # Find the wire connected to this specific input port
                     for wire in blk.in_wires[:]:  # Copy list to avoid modification during iteration
                         if hasattr(wire, 'to_port') and wire.to_port == clicked_port:
@@ -260,7 +383,7 @@ class FlowchartCanvas(QGraphicsView):
             # This is a new output port assignment, start wire creation
             self._dragging_from = blk
             self._dragging_from_port = clicked_port
-            p0 = it.mapToScene(it.rect().center())
+            p0 = it.scene_center()
             if p0 is not None:
                 # Start with auto-routed wire for preview
                 self._wire_start_point = p0
@@ -270,6 +393,10 @@ class FlowchartCanvas(QGraphicsView):
                     scene.addItem(self._temp_wire)
             return
         super().mousePressEvent(event)
+        # Blocks a left-button drag will move: the selection after the press
+        # has been handled, looked up once here instead of on every move
+        if event.button() == Qt.MouseButton.LeftButton and scene is not None:
+            self._moving_blocks = [i for i in scene.selectedItems() if isinstance(i, DraggableBlock)]
 
     def mouseMoveEvent(self, event):
         if event is None:
@@ -286,58 +413,77 @@ class FlowchartCanvas(QGraphicsView):
                 self._temp_wire.update_path()
         else:
             super().mouseMoveEvent(event)
-            # Enforce boundaries and prevent overlap for all selected blocks
+            # Only a left-button press on a block starts a move; plain hover
+            # moves (mouse tracking is on for port hover) have nothing to do
+            blocks = self._moving_blocks
             scene = self.scene()
-            if scene is not None:
+            if blocks and scene is not None:
+                # Enforce boundaries for all selected blocks
                 sr = scene.sceneRect()
                 cs = self.cell_size
-                blocks = [i for i in scene.selectedItems() if isinstance(i, DraggableBlock)]
                 for blk in blocks:
-                    w, h = blk.boundingRect().width(), blk.boundingRect().height()
-                    x = min(max(blk.x(), cs), sr.width() - w)
-                    y = min(max(blk.y(), cs), sr.height() - h)
-                    blk.setPos(QPointF(x, y))
+                    rect = blk.boundingRect()
+                    x = min(max(blk.x(), cs), sr.width() - rect.width())
+                    y = min(max(blk.y(), cs), sr.height() - rect.height())
+                    if x != blk.x() or y != blk.y():
+                        blk.setPos(QPointF(x, y))
                     # Remove overlap prevention - allow blocks to get close to each other
-                # Dynamically update wires for all blocks during move
-                for item in scene.items():
-                    # Skip non-blocks
-                    if not isinstance(item, DraggableBlock):
-                        continue
-                        
+                # Dynamically update wires of the moved blocks; a wire between two
+                # unselected blocks cannot change. Endpoints are set first and each
+                # changed wire rebuilt once, even if both its blocks moved
+                changed_wires = {}
+                for item in blocks:
+                    ports = item.ports
+                    # Scene position of each port, computed once per block per move
+                    port_pos = {}
+
                     # Update input wires
-                    for wire in getattr(item, 'in_wires', []):
+                    for wire in item.in_wires:
                         # Skip non-wire segments or wires without proper attributes
-                        if not isinstance(wire, WireSegment) or not hasattr(wire, 'to_port') or not wire.to_port:
+                        if not isinstance(wire, WireSegment) or not wire.to_port:
                             continue
                             
                         # Skip if port not in item ports
-                        if wire.to_port not in item.ports:
+                        port = ports.get(wire.to_port)
+                        if port is None or not wire.points:
                             continue
                             
-                        p_in = item.ports[wire.to_port].mapToScene(item.ports[wire.to_port].rect().center())
-                        if p_in is not None and len(wire.points) > 0:
+                        p_in = port_pos.get(wire.to_port)
+                        if p_in is None:
+                            p_in = port_pos[wire.to_port] = port.scene_center()
+                        if wire.points[-1] != p_in:
                             wire.points[-1] = p_in
-                            wire.update_path()
+                            changed_wires[wire] = None
                             
                     # Update output wires
-                    for wire in getattr(item, 'out_wires', []):
+                    for wire in item.out_wires:
                         # Skip non-wire segments or wires without proper attributes
-                        if not isinstance(wire, WireSegment) or not hasattr(wire, 'from_port') or not wire.from_port:
+                        if not isinstance(wire, WireSegment) or not wire.from_port:
                             continue
                             
                         # Skip if port not in item ports
-                        if wire.from_port not in item.ports:
+                        port = ports.get(wire.from_port)
+                        if port is None or not wire.points:
                             continue
                             
-                        p_out = item.ports[wire.from_port].mapToScene(item.ports[wire.from_port].rect().center())
-                        if p_out is not None and len(wire.points) > 0:
+                        p_out = port_pos.get(wire.from_port)
+                        if p_out is None:
+                            p_out = port_pos[wire.from_port] = port.scene_center()
+                        if wire.points[0] != p_out:
                             wire.points[0] = p_out
-                            wire.update_path()
+                            changed_wires[wire] = None
+
+                for wire in changed_wires:
+                    wire.update_path()
 
     def mouseReleaseEvent(self, event):
         # Ensure _wire_arrows is always available
         if not hasattr(self, '_wire_arrows'):
             self._wire_arrows = {}
+        self._moving_blocks = []
+        # End any block drag here; the block does not get the release while a
+        # wire is being drawn
+        _finish_drag()
         
         # Early return if no event
         if event is None:
@@ -361,25 +507,17 @@ class FlowchartCanvas(QGraphicsView):
         
         # First try: exact position match
         for item in items_at_pos:
-            # Skip non-ellipse items
-            if not isinstance(item, QGraphicsEllipseItem):
+            # Skip anything that is not a block port
+            if not isinstance(item, PortEllipse):
                 continue
                 
-            dst = item.parentItem()
+            dst = item.block
             # Skip non-blocks
             if not isinstance(dst, DraggableBlock):
                 continue
             
-            # Find which port this is
-            clicked_port = None
-            for port_name, port in dst.ports.items():
-                if port == item:
-                    clicked_port = port_name
-                    break
-            
-            # Skip if no port found
-            if not clicked_port:
-                continue
+            # Each port knows its own name
+            clicked_port = item.which
             
             # Allow self-connections for comparison blocks (feedback loops)
             if dst == self._dragging_from:
@@ -391,7 +529,7 @@ class FlowchartCanvas(QGraphicsView):
             if not dst.assign_input_port(clicked_port):
                 continue
                 
-            p1 = item.mapToScene(item.rect().center())
+            p1 = item.scene_center()
             # Skip if no temp wire
             if not self._temp_wire:
                 continue
@@ -413,8 +551,7 @@ class FlowchartCanvas(QGraphicsView):
             self._temp_wire.to_port = clicked_port
             
             # Check for comparison block Y/N condition prompt (for output ports)
-            from editor.logic_blocks import LogicBlock
-            if (isinstance(self._dragging_from, LogicBlock) and 
+            if (LOGIC_BLOCKS_AVAILABLE and isinstance(self._dragging_from, LogicBlock) and 
                 hasattr(self._dragging_from, 'handle_wire_connection') and 
                 hasattr(self._dragging_from, 'has_multiple_outputs') and 
                 self._dragging_from.has_multiple_outputs):
@@ -436,8 +573,7 @@ class FlowchartCanvas(QGraphicsView):
             # Add to wire lists
             if self._dragging_from:
                 # For non-comparison blocks, enforce single output wire
-                from editor.logic_blocks import LogicBlock
-                if (isinstance(self._dragging_from, LogicBlock) and 
+                if (LOGIC_BLOCKS_AVAILABLE and isinstance(self._dragging_from, LogicBlock) and 
                     hasattr(self._dragging_from, 'has_multiple_outputs') and 
                     not self._dragging_from.has_multiple_outputs and
                     len(self._dragging_from.out_wires) > 0):
@@ -447,14 +583,14 @@ class FlowchartCanvas(QGraphicsView):
                 
                 self._dragging_from.out_wires.append(self._temp_wire)
             dst.in_wires.append(self._temp_wire)
+            self._track_wire(self._temp_wire)
             
             # Update port colors
             if self._dragging_from:
                 self._dragging_from.update_port_colors()
             dst.update_port_colors()
             
-            # Emit project modified signal
-            self.project_modified.emit()
+            self._mark_modified()
             
             placed = True
             port_found = True
@@ -469,34 +605,30 @@ class FlowchartCanvas(QGraphicsView):
         # Second try: nearby ports if no exact match (for segmented wires)
         if not port_found:
             tolerance = 25  # Increased tolerance for segmented wires
-            for item in scene.items():
-                # Skip non-ellipse items
-                if not isinstance(item, QGraphicsEllipseItem):
+            # Only items around the mouse can be within tolerance, so query that
+            # square through the scene index instead of walking the whole scene
+            search_rect = QRectF(scene_pt.x() - tolerance, scene_pt.y() - tolerance,
+                                 2 * tolerance, 2 * tolerance)
+            for item in scene.items(search_rect):
+                # Skip anything that is not a block port
+                if not isinstance(item, PortEllipse):
                     continue
                     
-                dst = item.parentItem()
+                dst = item.block
                 # Skip non-blocks
                 if not isinstance(dst, DraggableBlock):
                     continue
                 
                 # Check if mouse is near this port
-                port_center = item.mapToScene(item.rect().center())
+                port_center = item.scene_center()
                 mouse_distance = (scene_pt - port_center).manhattanLength()
                 
                 # Skip if not within tolerance
                 if mouse_distance > tolerance:
                     continue
                     
-                # Find which port this is
-                clicked_port = None
-                for port_name, port in dst.ports.items():
-                    if port == item:
-                        clicked_port = port_name
-                        break
-                
-                # Skip if no port found
-                if not clicked_port:
-                    continue
+                # Each port knows its own name
+                clicked_port = item.which
                 
                 # Allow self-connections for comparison blocks (feedback loops)
                 if dst == self._dragging_from:
@@ -532,8 +664,7 @@ class FlowchartCanvas(QGraphicsView):
                 # Add to wire lists
                 if self._dragging_from:
                     # For non-comparison blocks, enforce single output wire
-                    from editor.logic_blocks import LogicBlock
-                    if (isinstance(self._dragging_from, LogicBlock) and 
+                    if (LOGIC_BLOCKS_AVAILABLE and isinstance(self._dragging_from, LogicBlock) and 
                         hasattr(self._dragging_from, 'has_multiple_outputs') and 
                         not self._dragging_from.has_multiple_outputs and
                         len(self._dragging_from.out_wires) > 0):
@@ -543,6 +674,7 @@ class FlowchartCanvas(QGraphicsView):
                     
                     self._dragging_from.out_wires.append(self._temp_wire)
                 dst.in_wires.append(self._temp_wire)
+                self._track_wire(self._temp_wire)
                 
                 # Update port colors
                 if self._dragging_from:
@@ -595,6 +727,7 @@ class FlowchartCanvas(QGraphicsView):
                     continue  # Prevent StartBlock deletion
                 else:
                     scene.removeItem(itm)
+                    self._untrack_block(itm)
             self._expand_scene()
             return
         if event.matches(QKeySequence.StandardKey.Copy):
@@ -606,21 +739,18 @@ class FlowchartCanvas(QGraphicsView):
             
             # Store selected blocks with their text and positions
             for blk in sel:
-                text = blk.text_item.toPlainText()
+                text = blk.text()
                 pos = blk.pos()
                 self._copy_buffer.append((text, pos))
                 
-            # Store wire connections between selected blocks
+            # Store wire connections between selected blocks; the index map makes
+            # finding each wire's destination one lookup instead of a scan of sel
+            sel_index = {blk: i for i, blk in enumerate(sel)}
             for i, src_blk in enumerate(sel):
                 for wire in getattr(src_blk, 'out_wires', []):
-                    # Skip if wire has no to_block attribute
-                    if not hasattr(wire, 'to_block'):
-                        continue
-                        
-                    for j, dst_blk in enumerate(sel):
-                        if wire.to_block == dst_blk:
-                            self._wire_buffer.append((i, j, wire.from_port, wire.to_port))
-                            break
+                    j = sel_index.get(getattr(wire, 'to_block', None))
+                    if j is not None:
+                        self._wire_buffer.append((i, j, wire.from_port, wire.to_port))
             return
 
         if event.matches(QKeySequence.StandardKey.Paste):
@@ -630,15 +760,17 @@ class FlowchartCanvas(QGraphicsView):
             new_blocks = []
             scene = self.scene()
             
-            # Create new blocks
+            # Create new blocks, sized from one lookup of the configuration
+            block_sizes = self._current_block_sizes()
             for text, pos in self._copy_buffer:
-                # Get size from configuration
-                width, height = self.get_block_size(text)
+                width, height = block_sizes.get(text, DEFAULT_BLOCK_SIZE)
                 blk = DraggableBlock(QRectF(0,0,width,height), text)
+                # Offset paste position; set before adding so the scene indexes
+                # the block once, at its final place
+                blk.setPos(pos + QPointF(50, 50))
                 if scene is not None:
                     scene.addItem(blk)
-                # Offset paste position
-                blk.setPos(pos + QPointF(50, 50))
+                    self._track_block(blk)
                 new_blocks.append(blk)
             
             # Recreate wire connections
@@ -655,8 +787,8 @@ class FlowchartCanvas(QGraphicsView):
                 dst_blk.assign_input_port(to_port)
                 
                 # Create wire
-                p_out = src_blk.ports[from_port].mapToScene(src_blk.ports[from_port].rect().center())
-                p_in = dst_blk.ports[to_port].mapToScene(dst_blk.ports[to_port].rect().center())
+                p_out = src_blk.ports[from_port].scene_center()
+                p_in = dst_blk.ports[to_port].scene_center()
                 
                 # Skip if positions are not valid
                 if not p_out or not p_in:
@@ -675,6 +807,7 @@ class FlowchartCanvas(QGraphicsView):
                 
                 if scene is not None:
                     scene.addItem(wire)
+                    self._track_wire(wire)
             
             # Update port colors for all new blocks
             for blk in new_blocks:
@@ -696,9 +829,12 @@ class FlowchartCanvas(QGraphicsView):
                         scene.removeItem(mid_arrow)
                 self._wire_arrows.pop(wire)
             scene.removeItem(wire)
+            self._untrack_wire(wire)
             
-            # Remove wire from blocks and reset ports if no wires remain
-            for blk in scene.items() if scene is not None else []:
+            # Remove wire from blocks and reset ports if no wires remain; every
+            # wire records both ends, so only those two blocks need checking
+            ends = (getattr(wire, 'from_block', None), getattr(wire, 'to_block', None))
+            for blk in dict.fromkeys(ends):
                 if isinstance(blk, DraggableBlock):
                     wire_removed = False
                     
@@ -707,7 +843,7 @@ class FlowchartCanvas(QGraphicsView):
                         blk.in_wires.remove(wire)
                         wire_removed = True
                         # Remove the specific input port that was disconnected
-                        if hasattr(wire, 'to_port') and wire.to_port in blk.input_ports:
+                        if hasattr(wire, 'to_port') and blk.has_input_port(wire.to_port):
                             blk.remove_input_port(wire.to_port)
                     
                     # Handle output wire removal
@@ -716,8 +852,7 @@ class FlowchartCanvas(QGraphicsView):
                         wire_removed = True
                         
                         # Handle comparison block condition reset
-                        from editor.logic_blocks import LogicBlock
-                        if (isinstance(blk, LogicBlock) and 
+                        if (LOGIC_BLOCKS_AVAILABLE and isinstance(blk, LogicBlock) and 
                             hasattr(blk, 'handle_wire_removal') and 
                             hasattr(blk, 'has_multiple_outputs') and 
                             blk.has_multiple_outputs and
@@ -731,130 +866,109 @@ class FlowchartCanvas(QGraphicsView):
                         # Just update colors for partial disconnections
                         blk.update_port_colors()
             
-            # Emit project modified signal when wire is removed
-            self.project_modified.emit()
-    def _draw_grid(self):
-        scene = self.scene()
-        if scene is None:
+            # Wire removed
+            self._mark_modified()
+
+    def _mark_modified(self):
+        """Queue a single project_modified emission for the current event-loop pass"""
+        if not self._modified_timer.isActive():
+            self._modified_timer.start()
+
+    def drawBackground(self, painter, rect):
+        """Paint the grid lines and row/column labels that fall inside rect"""
+        super().drawBackground(painter, rect)
+        if painter is None:
             return
-        for x in range(1, self.drawn_cols+1):
-            lbl = ""
-            col = x
-            while col:
-                col, r = divmod(col-1, 26)
-                lbl = chr(65+r) + lbl
-            t = scene.addText(lbl)
-            if t:
-                t.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIgnoresTransformations)
-                t.setPos(x*self.cell_size, 0)
-                t.setZValue(-1)
-            ln = scene.addLine(
-                x*self.cell_size, 0,
-                x*self.cell_size, (self.drawn_rows+1)*self.cell_size,
-                self.pen
-            )
-            if ln:
-                ln.setZValue(-1)
-
-        for y in range(1, self.drawn_rows+1):
-            t = scene.addText(str(y))
-            if t:
-                t.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIgnoresTransformations)
-                t.setPos(0, y*self.cell_size)
-                t.setZValue(-1)
-            ln = scene.addLine(
-                0, y*self.cell_size,
-                (self.drawn_cols+1)*self.cell_size, y*self.cell_size,
-                self.pen
-            )
-            if ln:
-                ln.setZValue(-1)
+        cs = self.cell_size
+        left, top, right, bottom = rect.left(), rect.top(), rect.right(), rect.bottom()
+        # Labels sit just right of / below their line, so start one cell early
+        first_col = max(1, int(left // cs))
+        last_col = min(self.drawn_cols, int(right // cs))
+        first_row = max(1, int(top // cs))
+        last_row = min(self.drawn_rows, int(bottom // cs))
+
+        # Full-length lines are built once per grid size and sliced to the
+        # visible range; the widget clip trims them to the exposed area
+        lines = self._grid_lines
+        if lines is None:
+            lines = self._grid_lines = self._build_grid_lines()
+        vertical, horizontal = lines
+        painter.setPen(self.pen)
+        if top < (self.drawn_rows + 1) * cs and first_col <= last_col:
+            painter.drawLines(vertical[first_col - 1:last_col])
+        if left < (self.drawn_cols + 1) * cs and first_row <= last_row:
+            painter.drawLines(horizontal[first_row - 1:last_row])
+
+        # Column letters along the top edge, row numbers down the left edge
+        painter.setPen(GRID_LABEL_COLOR)
+        if top < cs:
+            for x in range(first_col, last_col + 1):
+                painter.drawStaticText(QPointF(x * cs + 4, 4), _grid_label(_column_label(x)))
+        if left < cs:
+            for y in range(first_row, last_row + 1):
+                painter.drawStaticText(QPointF(4, y * cs + 4), _grid_label(str(y)))
+
+    def _build_grid_lines(self):
+        """Return (vertical, horizontal) QLineF lists spanning the whole grid"""
+        cs = self.cell_size
+        width = (self.drawn_cols + 1) * cs
+        height = (self.drawn_rows + 1) * cs
+        vertical = [QLineF(x * cs, 0, x * cs, height) for x in range(1, self.drawn_cols + 1)]
+        horizontal = [QLineF(0, y * cs, width, y * cs) for y in range(1, self.drawn_rows + 1)]
+        return vertical, horizontal
 
     def _expand_scene(self):
         scene = self.scene()
         if scene is None:
             return
-        blocks = [i for i in scene.items() if isinstance(i, DraggableBlock)]
+        cs = self.cell_size
+        col_margin, row_margin = 10, 50
+        # Only blocks reaching into the last margin's worth of cells can grow
+        # the grid, so query those edge strips through the scene index instead
+        # of walking every item (one cell of slack for blocks touching a strip)
+        sr = scene.sceneRect()
+        strip_x = (self.drawn_cols - col_margin - 1) * cs
+        strip_y = (self.drawn_rows - row_margin - 1) * cs
+        edge_items = scene.items(QRectF(strip_x, 0, sr.width(), sr.height()))
+        edge_items += scene.items(QRectF(0, strip_y, sr.width(), sr.height()))
+        blocks = [i for i in edge_items if isinstance(i, DraggableBlock)]
         max_x = max((b.pos().x()+b.boundingRect().width()) for b in blocks) if blocks else 0
         max_y = max((b.pos().y()+b.boundingRect().height()) for b in blocks) if blocks else 0
-        req_c = max(self.cols, int(max_x//self.cell_size)+1)
-        req_r = max(self.rows, int(max_y//self.cell_size)+1)
-        tgt_c = req_c + 10
-        tgt_r = req_r + 50
-        old_c, old_r = self.drawn_cols, self.drawn_rows
-
-        if tgt_c > old_c:
-            old_w = (old_c+1)*self.cell_size
-            new_w = (tgt_c+1)*self.cell_size
-            for x in range(old_c+1, tgt_c+1):
-                lbl = ""; col = x
-                while col:
-                    col, r = divmod(col-1, 26)
-                    lbl = chr(65+r) + lbl
-                t = scene.addText(lbl)
-                if t:
-                    t.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIgnoresTransformations)
-                    t.setPos(x*self.cell_size, 0)
-                    t.setZValue(-1)
-                ln = scene.addLine(
-                    x*self.cell_size, 0,
-                    x*self.cell_size, (tgt_r+1)*self.cell_size,
-                    self.pen
-                )
-                if ln:
-                    ln.setZValue(-1)
-            for y in range(1, old_r+1):
-                ln = scene.addLine(
-                    old_w, y*self.cell_size,
-                    new_w, y*self.cell_size,
-                    self.pen
-                )
-                if ln:
-                    ln.setZValue(-1)
-            self.drawn_cols = tgt_c
-
-        if tgt_r > old_r:
-            old_h = (old_r+1)*self.cell_size
-            new_h = (tgt_r+1)*self.cell_size
-            for y in range(old_r+1, tgt_r+1):
-                t = scene.addText(str(y))
-                if t:
-                    t.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIgnoresTransformations)
-                    t.setPos(0, y*self.cell_size)
-                    t.setZValue(-1)
-                ln = scene.addLine(
-                    0, y*self.cell_size,
-                    (self.drawn_cols+1)*self.cell_size, y*self.cell_size,
-                    self.pen
-                )
-                if ln:
-                    ln.setZValue(-1)
-            for x in range(1, self.drawn_cols+1):
-                ln = scene.addLine(
-                    x*self.cell_size, old_h,
-                    x*self.cell_size, new_h,
-                    self.pen
-                )
-                if ln:
-                    ln.setZValue(-1)
-            self.drawn_rows = tgt_r
+        req_c = max(self.cols, int(max_x//cs)+1)
+        req_r = max(self.rows, int(max_y//cs)+1)
+        tgt_c = req_c + col_margin
+        tgt_r = req_r + row_margin
+
+        grown = tgt_c > self.drawn_cols or tgt_r > self.drawn_rows
+        self.drawn_cols = max(self.drawn_cols, tgt_c)
+        self.drawn_rows = max(self.drawn_rows, tgt_r)
 
         w = (self.drawn_cols+1)*self.cell_size
         h = (self.drawn_rows+1)*self.cell_size
         scene.setSceneRect(0, 0, w, h)
+        if grown:
+            # The grid is painted by drawBackground() and cached by the view;
+            # invalidating the background layer drops that cache too
+            self._grid_lines = None
+            scene.invalidate(QRectF(), QGraphicsScene.SceneLayer.BackgroundLayer)
 
     # Project Management Methods
     def clear_canvas(self):
         """Clear all blocks and wires from the canvas"""
         scene = self.scene()
         if scene is not None:
-            # Remove all items except grid elements
-            for item in scene.items():
-                if isinstance(item, (DraggableBlock, WireSegment, AutoRoutedWire)):
+            # Remove all blocks and wires, including a wire still being drawn
+            for item in list(self._blocks) + list(self._wires):
+                if item.scene() is scene:
                     scene.removeItem(item)
+            if self._temp_wire is not None and self._temp_wire.scene() is scene:
+                scene.removeItem(self._temp_wire)
             
-            # Clear wire tracking
+            # Clear wire and block tracking
             self._wire_arrows.clear()
+            for block in list(self._blocks):
+                self._untrack_block(block)
+            self._wires.clear()
             self._temp_wire = None
             self._dragging_from = None
             self._dragging_from_port = None
@@ -863,82 +977,170 @@ class FlowchartCanvas(QGraphicsView):
             from editor.start_block import StartBlock
             start_block = StartBlock()
             scene.addItem(start_block)
+            self._track_block(start_block)
             start_block.setPos(self.cell_size, self.cell_size)  # Position at A1
 
-    def get_project_data(self):
-        """Export current canvas state to a dictionary"""
-        scene = self.scene()
-        if scene is None:
-            return {
-                "blocks": [], 
-                "wires": [], 
-                "canvas_data": {
-                    "zoom": 1.0,
-                    "scroll_x": 0,
-                    "scroll_y": 0,
-                    "cell_size": self.cell_size,
-                    "grid_enabled": True
-                },
-                "version": "1.0"
-            }
+    def scene_items_by_kind(self):
+        """
+        Return the blocks and connected wires on the canvas
+        
+        Read from the registries maintained as items are added and removed,
+        so no scene.items() walk over ports and other children is needed.
+        A wire still being drawn is not connected and is left out.
         
-        blocks_data = []
-        wires_data = []
+        Returns:
+            Tuple of (blocks, wires) lists
+        """
+        return list(self._blocks), list(self._wires)
+
+    def iter_block_data(self, blocks=None):
+        """
+        Yield the serializable dictionary of each block on the canvas
         
-        # Export blocks
-        for item in scene.items():
-            if isinstance(item, DraggableBlock):
-                block_data = {
-                    "id": id(item),  # Use object id as unique identifier
+        Coordinates are tuples, which both JSON backends write as arrays
+        """
+        if blocks is None:
+            blocks = self.scene_items_by_kind()[0]
+        for item in blocks:
+            pos = item.pos()
+            rect = item._rect
+            yield {
+                "id": item.uid,  # Small per-session id, referenced by wires
+                "type": item.__class__.__name__,
+                "text": item.text(),
+                "position": (pos.x(), pos.y()),
+                "input_ports": list(item.input_ports),
+                "output_port": item.output_port,
+                "size": (rect.width(), rect.height())
+            }
+
+    def iter_wire_data(self, wires=None):
+        """Yield the serializable dictionary of each connected wire"""
+        if wires is None:
+            wires = self.scene_items_by_kind()[1]
+        for item in wires:
+            if hasattr(item, 'from_block') and hasattr(item, 'to_block'):
+                wire_data = {
                     "type": item.__class__.__name__,
-                    "text": item.text_item.toPlainText() if item.text_item else "",
-                    "position": [item.pos().x(), item.pos().y()],
-                    "input_ports": list(item.input_ports),
-                    "output_port": item.output_port,
-                    "size": [item._rect.width(), item._rect.height()]
+                    "from_block": getattr(item.from_block, 'uid', None),
+                    "from_port": item.from_port,
+                    "to_block": getattr(item.to_block, 'uid', None),
+                    "to_port": item.to_port
                 }
-                blocks_data.append(block_data)
-        
-        # Export wires  
-        for item in scene.items():
-            if isinstance(item, (WireSegment, AutoRoutedWire)):
-                if hasattr(item, 'from_block') and hasattr(item, 'to_block'):
-                    wire_data = {
-                        "type": item.__class__.__name__,
-                        "from_block": id(item.from_block),
-                        "from_port": item.from_port,
-                        "to_block": id(item.to_block),
-                        "to_port": item.to_port
-                    }
-                    # Add specific data for different wire types
-                    if isinstance(item, WireSegment) and hasattr(item, 'points'):
-                        wire_data["points"] = [[p.x(), p.y()] for p in item.points]
-                    elif isinstance(item, AutoRoutedWire):
-                        wire_data["start_point"] = [item.start_point.x(), item.start_point.y()]
-                        wire_data["end_point"] = [item.end_point.x(), item.end_point.y()]
-                    
-                    wires_data.append(wire_data)
-        
+                # Add specific data for different wire types
+                if isinstance(item, WireSegment) and hasattr(item, 'points'):
+                    wire_data["points"] = [(p.x(), p.y()) for p in item.points]
+                elif isinstance(item, AutoRoutedWire):
+                    start, end = item.start_point, item.end_point
+                    wire_data["start_point"] = (start.x(), start.y())
+                    wire_data["end_point"] = (end.x(), end.y())
+                
+                yield wire_data
+
+    def get_canvas_data(self):
+        """Export view settings (zoom, scroll, grid) to a dictionary"""
+        return {
+            "zoom": self.transform().m11(),  # Get current zoom level
+            "scroll_x": self.horizontalScrollBar().value() if self.horizontalScrollBar() else 0,
+            "scroll_y": self.verticalScrollBar().value() if self.verticalScrollBar() else 0,
+            "cell_size": self.cell_size,
+            "grid_enabled": True,
+            "canvas_size": [self.cols, self.rows]
+        }
+
+    def get_project_data(self):
+        """Export current canvas state to a dictionary"""
+        blocks, wires = self.scene_items_by_kind()
         return {
             "version": "1.0",
-            "blocks": blocks_data,
-            "wires": wires_data,
-            "canvas_data": {
-                "zoom": self.transform().m11(),  # Get current zoom level
-                "scroll_x": self.horizontalScrollBar().value() if self.horizontalScrollBar() else 0,
-                "scroll_y": self.verticalScrollBar().value() if self.verticalScrollBar() else 0,
-                "cell_size": self.cell_size,
-                "grid_enabled": True,
-                "canvas_size": [self.cols, self.rows]
-            }
+            "blocks": list(self.iter_block_data(blocks)),
+            "wires": list(self.iter_wire_data(wires)),
+            "canvas_data": self.get_canvas_data()
         }
 
+    # Top-level sections produced by the canvas, in file order
+    PROJECT_SECTIONS = ("version", "blocks", "wires", "canvas_data")
+
+    def stream_section(self, write, section, items=None):
+        """
+        Write one canvas section as a JSON value, streaming blocks/wires item by item
+        
+        Args:
+            write: Callable taking bytes (e.g. an open binary file's write)
+            section: One of PROJECT_SECTIONS
+            items: Optional (blocks, wires) from scene_items_by_kind(), shared
+                across sections of one save
+        """
+        if section == "blocks":
+            write(b'[')
+            self._stream_items(write, self.iter_block_data(items[0] if items else None))
+            write(b']')
+        elif section == "wires":
+            write(b'[')
+            self._stream_items(write, self.iter_wire_data(items[1] if items else None))
+            write(b']')
+        elif section == "canvas_data":
+            write(json_io.dumps(self.get_canvas_data()))
+        elif section == "version":
+            write(b'"1.0"')
+        else:
+            raise ValueError(f"Unknown canvas section: {section}")
+
+    def stream_project_data(self, write, extra_sections=None):
+        """
+        Write the canvas state as a JSON project document, one block/wire at a time
+        
+        Produces the same structure as get_project_data() without building the
+        full block and wire lists in memory.
+        
+        Args:
+            write: Callable taking bytes (e.g. an open binary file's write)
+            extra_sections: Optional dict of additional top-level sections
+        """
+        dumps = json_io.dumps
+        items = self.scene_items_by_kind()
+        separator = b'{\n'
+        for section in self.PROJECT_SECTIONS:
+            write(separator + dumps(section) + b': ')
+            self.stream_section(write, section, items)
+            separator = b',\n'
+        for key, value in (extra_sections or {}).items():
+            write(b',\n' + dumps(key) + b': ' + dumps(value))
+        write(b'\n}\n')
+
+    @staticmethod
+    def _stream_items(write, items):
+        """Write serialized items separated by commas"""
+        separator = b'\n'
+        for item in items:
+            write(separator)
+            write(json_io.dumps(item))
+            separator = b',\n'
+        if separator != b'\n':
+            write(b'\n')
+
     def load_project(self, project_data):
         """Load project data into the canvas"""
         scene = self.scene()
         if scene is None:
             return
         
+        # Add everything unindexed and unpainted, then index and repaint once
+        index_method = scene.itemIndexMethod()
+        update_mode = self.viewportUpdateMode()
+        scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.NoViewportUpdate)
+        try:
+            self._load_project_items(scene, project_data)
+        finally:
+            scene.setItemIndexMethod(index_method)
+            self.setViewportUpdateMode(update_mode)
+            vp = self.viewport()
+            if vp is not None:
+                vp.update()
+
+    def _load_project_items(self, scene, project_data):
+        """Replace the canvas contents with the blocks and wires in project_data"""
         # Clear existing content
         self.clear_canvas()
         
@@ -948,6 +1150,8 @@ class FlowchartCanvas(QGraphicsView):
         
         # Track loaded blocks by their original IDs for wire connections
         block_id_map = {}
+        # Configuration is checked once for the whole load
+        block_sizes = self._current_block_sizes()
         
         # Load blocks
         for block_data in project_data.get("blocks", []):
@@ -963,7 +1167,7 @@ class FlowchartCanvas(QGraphicsView):
                     text = block_data.get("text", "")
                     if text:
                         # Get the proper size from JSON config for this block type
-                        width, height = self.get_block_size(text)
+                        width, height = block_sizes.get(text, DEFAULT_BLOCK_SIZE)
                         rect = QRectF(0, 0, width, height)
                         block = DraggableBlock(rect, text)
                     else:
@@ -978,28 +1182,26 @@ class FlowchartCanvas(QGraphicsView):
                     block.setPos(pos[0], pos[1])
                 
                 # Restore block size (fallback if different from config)
-                if "size" in block_data:
-                    size = block_data["size"]
-                    current_size = [block._rect.width(), block._rect.height()]
-                    if current_size != size:
+                size = block_data.get("size")
+                if size:
+                    width, height = size[0], size[1]
+                    rect = block._rect
+                    if rect.width() != width or rect.height() != height:
                         # Only update if different from current size
-                        block._rect.setWidth(size[0])
-                        block._rect.setHeight(size[1])
+                        rect.setWidth(width)
+                        rect.setHeight(height)
                         # Update port positions after size change
-                        if hasattr(block, 'update_port_positions'):
-                            block.update_port_positions()
-                        # Update the text centering after size change
-                        if hasattr(block, '_center_text'):
-                            block._center_text()
+                        block.update_port_positions()
                 
                 # Restore port assignments
                 if "input_ports" in block_data:
-                    block.input_ports = set(block_data["input_ports"])
+                    block.set_input_ports(block_data["input_ports"])
                 if "output_port" in block_data:
                     block.output_port = block_data["output_port"]
                 
                 # Add to scene and track ID mapping
                 scene.addItem(block)
+                self._track_block(block)
                 block_id_map[block_data.get("id")] = block
                 
             except Exception as e:
@@ -1037,12 +1239,7 @@ class FlowchartCanvas(QGraphicsView):
                     wire.to_block = to_block
                     wire.to_port = wire_data.get("to_port")
                     
-                    # Add wire to blocks' wire lists
-                    if not hasattr(from_block, 'out_wires'):
-                        from_block.out_wires = []
-                    if not hasattr(to_block, 'in_wires'):
-                        to_block.in_wires = []
-                    
+                    # Add wire to blocks' wire lists (created by DraggableBlock.__init__)
                     from_block.out_wires.append(wire)
                     to_block.in_wires.append(wire)
                     
@@ -1051,6 +1248,7 @@ class FlowchartCanvas(QGraphicsView):
                     to_block.assign_input_port(wire.to_port)
                     
                     scene.addItem(wire)
+                    self._track_wire(wire)
                     
             except Exception as e:
                 print(f"Error loading wire: {e}")
@@ -1058,7 +1256,6 @@ class FlowchartCanvas(QGraphicsView):
         
         # Update all block colors after loading
         for block in block_id_map.values():
-            if hasattr(block, 'update_port_colors'):
-                block.update_port_colors()
+            block.update_port_colors()
         
         print(f"Project loaded: {len(block_id_map)} blocks, {len(project_data.get('wires', []))} wires")
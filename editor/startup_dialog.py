@@ -0,0 +1,39 @@
+from enum import IntEnum
+
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
+from PyQt6.QtCore import Qt
+
+
+class StartupChoice(IntEnum):
+    """Result codes returned by StartupChoiceDialog.exec()"""
+    SKIP = 0
+    NEW_PROJECT = 1
+    OPEN_PROJECT = 2
+
+
+class StartupChoiceDialog(QDialog):
+    """Lightweight project selection dialog shown at launch"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("ESP32 PLC GUI - Project Selection")
+
+        layout = QVBoxLayout(self)
+        title = QLabel("<b>Welcome to ESP32 PLC GUI</b>")
+        layout.addWidget(title, alignment=Qt.AlignmentFlag.AlignHCenter)
+        layout.addWidget(QLabel("Would you like to create a new project or open an existing one?"))
+
+        btn_layout = QHBoxLayout()
+        self.new_btn = QPushButton("New Project")
+        self.open_btn = QPushButton("Open Existing")
+        self.skip_btn = QPushButton("Skip")
+        btn_layout.addWidget(self.new_btn)
+        btn_layout.addWidget(self.open_btn)
+        btn_layout.addWidget(self.skip_btn)
+        layout.addLayout(btn_layout)
+
+        self.new_btn.setDefault(True)
+        self.new_btn.clicked.connect(lambda: self.done(StartupChoice.NEW_PROJECT))
+        self.open_btn.clicked.connect(lambda: self.done(StartupChoice.OPEN_PROJECT))
+        # Closing the dialog (Esc / window close) reports SKIP like the Skip button
+        self.skip_btn.clicked.connect(lambda: self.done(StartupChoice.SKIP))
@@ -0,0 +1,47 @@
+"""
+Background loading of the tag-related JSON files
+
+The Tags dialog needs esp32_config.json and tags_config.json. Parsing
+them on a QThreadPool worker at startup keeps that work off the GUI
+thread; the VariablePanel then only builds its Qt widgets from the
+already-parsed dictionaries.
+"""
+
+import os
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from utils import json_io
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "templates")
+
+
+class TagLoadSignals(QObject):
+    """Signals for TagLoadWorker (QRunnable cannot emit signals itself)"""
+    # dict with "esp32_config" and "tags_config" (None if the file is missing)
+    finished = pyqtSignal(object)
+
+
+class TagLoadWorker(QRunnable):
+    """Parse the tag configuration files off the GUI thread"""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = TagLoadSignals()
+
+    @staticmethod
+    def _read_json(file_name):
+        path = os.path.join(TEMPLATES_DIR, file_name)
+        try:
+            with open(path, 'rb') as f:
+                return json_io.loads(f.read())
+        except (OSError, ValueError) as e:
+            print(f"Could not preload {file_name}: {e}")
+            return None
+
+    def run(self):
+        data = {
+            "esp32_config": self._read_json("esp32_config.json"),
+            "tags_config": self._read_json("tags_config.json"),
+        }
+        self.signals.finished.emit(data)
@@ -1,6 +1,6 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
 from editor.draggable_block import DraggableButton
-import json
+from utils import PLCProjectError, block_config_cache
 import os
 
 class Toolbox(QWidget):
@@ -21,9 +21,8 @@ class Toolbox(QWidget):
         """Load block configuration from JSON file"""
         try:
             config_path = os.path.join(os.path.dirname(__file__), "..", "templates", "block_config.json")
-            with open(config_path, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            return block_config_cache.load_block_config(config_path)
+        except PLCProjectError:
             # Fallback to hardcoded list if config file not found
             block_names = [
                 "Wire Router", "ON?", "OFF?", "<", ">", "<=", ">=", "=", "≠",
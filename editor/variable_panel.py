@@ -1,4 +1,3 @@
-import json
 import os
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, 
                             QTableWidgetItem, QComboBox, QCheckBox, QPushButton, 
@@ -8,6 +7,8 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont, QColor
 
+from utils import json_io
+
 # Handle imports for both direct execution and module import
 try:
     from .tag_model import Tag, PhysicalIOTag, RegisterTag, SoftwareTag
@@ -79,10 +80,18 @@ class VariablePanel(QWidget):
     # Signal emitted when tags are modified
     tags_modified = pyqtSignal()
     
-    def __init__(self):
+    def __init__(self, preloaded=None):
+        """
+        Args:
+            preloaded: Optional dict from TagLoadWorker with already parsed
+                "esp32_config" / "tags_config"; missing entries are read from disk
+        """
         super().__init__()
+        preloaded = preloaded or {}
         self.tags = []
-        self.esp32_config = self.load_esp32_config()
+        self.esp32_config = preloaded.get("esp32_config")
+        if self.esp32_config is None:
+            self.esp32_config = self.load_esp32_config()
         self.memory_allocator = ESP32MemoryAllocator()
         
         # Configure proper styling to fix highlighting issues
@@ -90,7 +99,7 @@ class VariablePanel(QWidget):
         
         # Initialize layout
         self.init_ui()
-        self.load_existing_tags()
+        self.load_existing_tags(preloaded.get("tags_config"))
 
     def init_ui(self):
         """Initialize the user interface"""
@@ -462,8 +471,8 @@ class VariablePanel(QWidget):
         config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
                                   "templates", "esp32_config.json")
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            with open(config_path, 'rb') as f:
+                return json_io.loads(f.read())
         except Exception as e:
             print(f"Failed to load ESP32 config: {e}")
             return {}
@@ -847,8 +856,8 @@ class VariablePanel(QWidget):
         try:
             config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
                                       "templates", "tags_config.json")
-            with open(config_path, 'w') as f:
-                json.dump(config, f, indent=2)
+            with open(config_path, 'wb') as f:
+                f.write(json_io.dumps(config))
             
             QMessageBox.information(self, "Success", "Tag configuration saved successfully!")
             
@@ -860,8 +869,8 @@ class VariablePanel(QWidget):
         try:
             config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
                                       "templates", "tags_config.json")
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            with open(config_path, 'rb') as f:
+                config = json_io.loads(f.read())
             
             self.load_tag_configuration(config)
             QMessageBox.information(self, "Success", "Tag configuration loaded successfully!")
@@ -869,18 +878,19 @@ class VariablePanel(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load tag configuration:\n{str(e)}")
 
-    def load_existing_tags(self):
-        """Load existing tags on startup"""
+    def load_existing_tags(self, config=None):
+        """Load existing tags on startup, from an already parsed config if given"""
         try:
-            config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
-                                      "templates", "tags_config.json")
-            # Early return if config doesn't exist
-            if not os.path.exists(config_path):
-                print("No existing tag configuration found - using defaults")
-                return
-                
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            if config is None:
+                config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
+                                          "templates", "tags_config.json")
+                # Early return if config doesn't exist
+                if not os.path.exists(config_path):
+                    print("No existing tag configuration found - using defaults")
+                    return
+                    
+                with open(config_path, 'rb') as f:
+                    config = json_io.loads(f.read())
             self.load_tag_configuration(config)
             print("Existing tag configuration loaded successfully")
             
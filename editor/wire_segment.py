@@ -1,11 +1,13 @@
 from PyQt6.QtWidgets import QGraphicsPathItem, QGraphicsItem, QGraphicsSceneMouseEvent
-from PyQt6.QtGui import QPainterPath, QPen, QColor
+from PyQt6.QtGui import QPainterPath, QPen, QColor, QPolygonF
 from PyQt6.QtCore import Qt, QPointF
 
 class WireSegment(QGraphicsPathItem):
     def __init__(self, points, parent=None):
         super().__init__(parent)
         self.points = points[:]  # List of QPointF
+        # Qt strokes the path anew on every shape() call; see shape()
+        self._shape = None
         self.setPen(QPen(QColor("black"), 3))
         self.setFlags(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable)
         self.setZValue(2)
@@ -23,11 +25,24 @@ class WireSegment(QGraphicsPathItem):
     def update_path(self):
         path = QPainterPath()
         if self.points:
-            path.moveTo(self.points[0])
-            for pt in self.points[1:]:
-                path.lineTo(pt)
+            # One call converts the whole point list into an open subpath
+            path.addPolygon(QPolygonF(self.points))
         self.setPath(path)
 
+    def setPath(self, path):
+        self._shape = None
+        super().setPath(path)
+
+    def setPen(self, pen):
+        self._shape = None
+        super().setPen(pen)
+
+    def shape(self):
+        """Stroked outline used for hit-tests, cached until the path or pen changes"""
+        if self._shape is None:
+            self._shape = super().shape()
+        return self._shape
+
     def mousePressEvent(self, event):
         # Select nearest handle (bend point)
         min_dist = 16
@@ -53,6 +68,18 @@ class WireSegment(QGraphicsPathItem):
         self.points.append(pt)
         self.update_path()
 
+    def update_endpoints(self, start_point: QPointF, end_point: QPointF):
+        """Reconnect the wire straight between two moved ports (drops bend points)"""
+        points = self.points
+        if len(points) == 2:
+            points[0] = start_point
+            points[1] = end_point
+        else:
+            self.points = [start_point, end_point]
+        path = QPainterPath(start_point)
+        path.lineTo(end_point)
+        self.setPath(path)
+
     def set_endpoints(self, start: QPointF, end: QPointF):
         if len(self.points) < 2:
             self.points = [start, end]
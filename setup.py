@@ -47,6 +47,10 @@ setup(
             "flake8>=4.0.0",
             "mypy>=0.991",
         ],
+        "speedups": [
+            "orjson>=3.9.0",
+            "fastjsonschema>=2.16.0",
+        ],
         "test": [
             "pytest>=7.0.0",
             "pytest-qt>=4.0.0",
@@ -59,7 +63,7 @@ setup(
     },
     include_package_data=True,
     package_data={
-        "": ["templates/*.json", "*.md", "*.txt"],
+        "": ["templates/*.json", "resources/*.qss", "*.md", "*.txt"],
     },
     keywords="esp32 plc gui flowchart microcontroller embedded automation",
     project_urls={
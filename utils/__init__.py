@@ -6,6 +6,9 @@ from .exceptions import *
 from .logger import get_logger, setup_logging
 from .validators import *
 from .error_handler import ErrorHandler, log_method_entry, retry_on_failure
+from . import block_config_cache
+from . import json_io
+from .project_container import is_project_container, read_project_container, write_project_container
 
 __all__ = [
     # Exceptions
@@ -18,9 +21,14 @@ __all__ = [
     
     # Validators
     'validate_file_path', 'validate_directory_path', 'validate_json_file',
+    'load_mapped_json_file',
     'validate_project_data', 'validate_tag_name', 'validate_gpio_pin',
     'validate_memory_size', 'validate_data_type',
     
     # Error handling
-    'ErrorHandler', 'log_method_entry', 'retry_on_failure'
+    'ErrorHandler', 'log_method_entry', 'retry_on_failure',
+    
+    # Caches and serialization
+    'block_config_cache', 'json_io',
+    'is_project_container', 'read_project_container', 'write_project_container'
 ]
@@ -0,0 +1,107 @@
+"""
+On-disk cache for the block configuration JSON
+
+The parsed and validated configuration is pickled next to the JSON file
+and reused as long as the JSON file's mtime and size are unchanged. Within
+one process the last result is also kept in memory, so repeated loads
+(toolbox, canvas, View > Reload Block Config) cost a single stat().
+Callers must treat the returned dictionary as read-only.
+"""
+
+import os
+import pickle
+from typing import Dict, Any
+
+from .exceptions import BlockConfigError
+from .logger import get_logger
+from .validators import validate_json_file
+
+logger = get_logger('BlockConfigCache')
+
+# Bump when the cached structure changes so stale caches are ignored
+CACHE_VERSION = 1
+
+# In-process cache: absolute path -> (cache key, configuration)
+_memory_cache: Dict[str, tuple] = {}
+
+
+def _cache_path(path: str) -> str:
+    return path + ".cache.pkl"
+
+
+def _cache_key(path: str) -> tuple:
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size, CACHE_VERSION)
+
+
+def _validate_block_config(config: Any, path: str) -> Dict[str, Any]:
+    """Check the minimal structure the toolbox and canvas rely on"""
+    if not isinstance(config, dict):
+        raise BlockConfigError(f"Block configuration must be a dictionary: {path}")
+    if not isinstance(config.get("block_types", {}), dict):
+        raise BlockConfigError(f"'block_types' must be a dictionary: {path}")
+    return config
+
+
+def _read_cache(path: str, key: tuple):
+    """Return the cached configuration, or None on a miss"""
+    try:
+        with open(_cache_path(path), 'rb') as f:
+            if pickle.load(f) != key:
+                return None
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+
+
+def _write_cache(path: str, key: tuple, config: Dict[str, Any]) -> None:
+    """Atomically write the cache; failures only cost the next load a re-parse"""
+    cache_path = _cache_path(path)
+    tmp_path = cache_path + ".tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"Could not write block config cache {cache_path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def load_block_config(path: str) -> Dict[str, Any]:
+    """
+    Load the block configuration, using the pickle cache when it is fresh
+
+    Args:
+        path: Path to block_config.json
+
+    Returns:
+        Parsed block configuration
+
+    Raises:
+        ProjectFileError: If the JSON file is missing or invalid
+        BlockConfigError: If the configuration structure is invalid
+    """
+    path = os.path.abspath(path)
+    try:
+        key = _cache_key(path)
+    except OSError:
+        key = None
+
+    if key is not None:
+        entry = _memory_cache.get(path)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        cached = _read_cache(path, key)
+        if cached is not None:
+            _memory_cache[path] = (key, cached)
+            return cached
+
+    config = _validate_block_config(validate_json_file(path), path)
+    if key is not None:
+        _write_cache(path, key, config)
+        _memory_cache[path] = (key, config)
+    return config
@@ -0,0 +1,43 @@
+"""
+JSON serialization helpers for project files
+
+orjson is used when it is installed; stdlib json is the fallback.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj) -> bytes:
+    """
+    Serialize obj to indented UTF-8 JSON bytes
+    
+    Args:
+        obj: JSON-compatible object (non-string dict keys are allowed)
+    
+    Returns:
+        Encoded JSON
+    
+    Raises:
+        TypeError: If obj contains a value that cannot be serialized
+    """
+    if orjson is not None:
+        # allocated_variables uses integer keys, hence OPT_NON_STR_KEYS
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def loads(data: bytes):
+    """
+    Parse JSON from bytes
+    
+    Raises:
+        ValueError: If data is not valid JSON (json.JSONDecodeError or orjson's subclass)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,71 @@
+"""
+Zip container format for .plc project files
+
+Each top-level project section is stored as its own deflated entry
+("blocks.json", "wires.json", "tags_configuration.json", ...), so a
+section can be written and parsed on its own. Plain JSON project files
+are still recognised by their first byte.
+"""
+
+import zipfile
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Tuple
+
+from .exceptions import ProjectFileError
+from .json_io import loads
+
+# Every zip archive starts with this local file header signature
+ZIP_MAGIC = b'PK\x03\x04'
+SECTION_SUFFIX = ".json"
+
+
+def is_project_container(file_path: str) -> bool:
+    """Return True if the file is a zip project container rather than plain JSON"""
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read(len(ZIP_MAGIC)) == ZIP_MAGIC
+    except OSError as e:
+        raise ProjectFileError(f"Cannot read file {file_path}: {e}")
+
+
+def write_project_container(fileobj: BinaryIO,
+                            sections: Iterable[Tuple[str, Callable[[Callable[[bytes], Any]], None]]]) -> None:
+    """
+    Write project sections into a zip container
+    
+    Args:
+        fileobj: Seekable binary file opened for writing
+        sections: (name, stream) pairs; stream(write) writes the section's JSON bytes
+    """
+    with zipfile.ZipFile(fileobj, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for name, stream in sections:
+            with zf.open(name + SECTION_SUFFIX, 'w') as entry:
+                stream(entry.write)
+
+
+def read_project_container(file_path: str) -> Dict[str, Any]:
+    """
+    Read every section of a zip project container
+    
+    Args:
+        file_path: Path to the .plc container
+    
+    Returns:
+        Project data dictionary keyed by section name
+    
+    Raises:
+        ProjectFileError: If the archive or one of its sections is invalid
+    """
+    data = {}
+    try:
+        with zipfile.ZipFile(file_path, 'r') as zf:
+            for name in zf.namelist():
+                if not name.endswith(SECTION_SUFFIX):
+                    continue
+                data[name[:-len(SECTION_SUFFIX)]] = loads(zf.read(name))
+    except zipfile.BadZipFile as e:
+        raise ProjectFileError(f"Invalid project archive {file_path}: {e}")
+    except ValueError as e:
+        raise ProjectFileError(f"Invalid JSON in project archive {file_path}: {e}")
+    except OSError as e:
+        raise ProjectFileError(f"Cannot read file {file_path}: {e}")
+    return data
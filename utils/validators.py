@@ -4,11 +4,39 @@ Input validation functions for ESP32 PLC GUI
 
 import os
 import json
+import mmap
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
 
 from .exceptions import ProjectFileError, ProjectDataError, VariableConfigError
 
+# orjson parses straight from a memory-mapped buffer; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Top-level shape of a .plc project file; must accept exactly what
+# _check_project_data accepts, so loading does not depend on fastjsonschema
+PROJECT_SCHEMA = {
+    "type": "object",
+    "required": ["blocks", "wires", "canvas_data"],
+    "properties": {
+        "blocks": {"type": "array"},
+        "wires": {"type": "array"},
+        "canvas_data": {"type": "object"},
+    },
+}
+
+# fastjsonschema compiles PROJECT_SCHEMA into a specialized validator once at
+# import time; without it validate_project_data uses the hand-written checks
+try:
+    import fastjsonschema
+    _project_schema_validator = fastjsonschema.compile(PROJECT_SCHEMA)
+except ImportError:
+    fastjsonschema = None
+    _project_schema_validator = None
+
 
 def validate_file_path(file_path: str, check_exists: bool = True, check_readable: bool = True) -> bool:
     """
@@ -109,6 +137,48 @@ def validate_json_file(file_path: str) -> Dict[str, Any]:
     return data
 
 
+def load_mapped_json_file(file_path: str) -> Dict[str, Any]:
+    """
+    Validate and load a (possibly large) JSON file through a memory map
+    
+    The file is mapped read-only and parsed straight from the mapped
+    buffer, so no intermediate Python string of the whole file is built.
+    
+    Args:
+        file_path: Path to JSON file
+    
+    Returns:
+        Parsed JSON data
+    
+    Raises:
+        ProjectFileError: If file validation or parsing fails
+    """
+    validate_file_path(file_path)
+    
+    # mmap cannot map an empty file
+    if os.path.getsize(file_path) == 0:
+        raise ProjectFileError(f"Invalid JSON in file {file_path}: file is empty")
+    
+    try:
+        with open(file_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if orjson is not None:
+                with memoryview(mm) as view:
+                    data = orjson.loads(view)
+            else:
+                data = json.loads(mm[:])
+    except json.JSONDecodeError as e:
+        raise ProjectFileError(f"Invalid JSON in file {file_path}: {e}")
+    except UnicodeDecodeError as e:
+        raise ProjectFileError(f"Encoding error in file {file_path}: {e}")
+    except PermissionError:
+        raise ProjectFileError(f"Permission denied reading file: {file_path}")
+    except OSError as e:
+        raise ProjectFileError(f"Cannot read file {file_path}: {e}")
+    
+    return data
+
+
 def validate_project_data(data: Dict[str, Any]) -> bool:
     """
     Validate project data structure
@@ -122,6 +192,20 @@ def validate_project_data(data: Dict[str, Any]) -> bool:
     Raises:
         ProjectDataError: If validation fails
     """
+    if _project_schema_validator is not None:
+        try:
+            _project_schema_validator(data)
+            return True
+        except fastjsonschema.JsonSchemaValueException as e:
+            # Re-run the hand-written checks for the same per-key message
+            _check_project_data(data)
+            raise ProjectDataError(f"Invalid project data: {e}")
+    
+    return _check_project_data(data)
+
+
+def _check_project_data(data: Dict[str, Any]) -> bool:
+    """Hand-written equivalent of PROJECT_SCHEMA, raising ProjectDataError"""
     # Early return if not a dictionary
     if not isinstance(data, dict):
         raise ProjectDataError("Project data must be a dictionary")